@@ -3,6 +3,7 @@ Download Daemon - Local torrent download service
 Runs locally, bundled with Flutter app
 """
 import os
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import Optional
@@ -133,7 +134,8 @@ async def start_download(request: DownloadRequest):
         )
 
     try:
-        download_id = download_manager.add_magnet(
+        download_id = await asyncio.to_thread(
+            download_manager.add_magnet,
             magnet_link=request.magnet_link,
             title=request.title
         )
@@ -159,7 +161,7 @@ async def get_downloads():
         raise HTTPException(status_code=503, detail="Download manager not available")
 
     try:
-        downloads = download_manager.get_all_downloads()
+        downloads = await asyncio.to_thread(download_manager.get_all_downloads)
 
         return {
             "downloads": [
@@ -189,7 +191,7 @@ async def get_download_info(download_id: str):
         raise HTTPException(status_code=503, detail="Download manager not available")
 
     try:
-        info = download_manager.get_download_info(download_id)
+        info = await asyncio.to_thread(download_manager.get_download_info, download_id)
 
         if not info:
             raise HTTPException(status_code=404, detail="Download not found")
@@ -230,12 +232,14 @@ async def delete_download(download_id: str):
 
     try:
         # Check if download exists
-        info = download_manager.get_download_info(download_id)
+        info = await asyncio.to_thread(download_manager.get_download_info, download_id)
         if not info:
             raise HTTPException(status_code=404, detail="Download not found")
 
         # Remove download (keep files)
-        success = download_manager.remove_download(download_id, delete_files=False)
+        success = await asyncio.to_thread(
+            download_manager.remove_download, download_id, delete_files=False
+        )
 
         if not success:
             raise HTTPException(status_code=500, detail="Failed to delete download")
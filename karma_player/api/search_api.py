@@ -31,13 +31,14 @@ logger = logging.getLogger(__name__)
 
 # Global search instance
 search_service: Optional[SimpleSearch] = None
+search_engine: Optional[SearchEngine] = None
 
 
 # Lifespan context manager for startup/shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle startup and shutdown events"""
-    global search_service
+    global search_service, search_engine
 
     logger.info(f"Starting {__app_name__} Search API v{__version__}")
     logger.info(f"API server running on port {config.SEARCH_API_PORT}")
@@ -71,7 +72,9 @@ async def lifespan(app: FastAPI):
 
     # Cleanup on shutdown
     logger.info("Shutting down search API...")
+    await search_engine.close()
     search_service = None
+    search_engine = None
 
 
 # Create FastAPI app
@@ -345,6 +348,8 @@ async def websocket_search(websocket: WebSocket):
     Client sends: {"query": "artist name", "format_filter": "FLAC", "min_seeders": 1, "limit": 50}
     Server sends:
         - Progress: {"type": "progress", "percent": 50, "message": "Searching..."}
+        - Partial: {"type": "partial", "data": {"results": [...]}} (unranked
+          sources, once per source as soon as it answers)
         - Result: {"type": "result", "data": {...}}
         - Error: {"type": "error", "message": "..."}
     """
@@ -379,13 +384,22 @@ async def websocket_search(websocket: WebSocket):
                 "message": message
             })
 
-        # Execute search with progress updates
+        # Partial results callback
+        async def send_partial(sources):
+            await websocket.send_json({
+                "type": "partial",
+                "data": {"results": [s.to_dict() for s in sources]}
+            })
+
+        # Execute search with progress updates, streaming each source's
+        # results before the final ranked list
         result = await search_service.search(
             query=query,
             format_filter=format_filter,
             min_seeders=min_seeders,
             limit=limit,
-            progress_callback=send_progress
+            progress_callback=send_progress,
+            results_callback=send_partial
         )
 
         # Convert to response format
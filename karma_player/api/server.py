@@ -3,6 +3,7 @@ FastAPI server for karma_player
 Provides HTTP/WebSocket API for Flutter GUI
 """
 import os
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import Optional, List
@@ -76,6 +77,7 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down...")
     if download_manager:
         download_manager.shutdown()
+    await search_engine.close()
     search_service = None
     download_manager = None
 
@@ -272,7 +274,8 @@ async def start_download(request: DownloadRequest):
         )
 
     try:
-        download_id = download_manager.add_magnet(
+        download_id = await asyncio.to_thread(
+            download_manager.add_magnet,
             magnet_link=request.magnet_link,
             title=request.title
         )
@@ -298,7 +301,7 @@ async def get_downloads():
         raise HTTPException(status_code=503, detail="Download manager not available")
 
     try:
-        downloads = download_manager.get_all_downloads()
+        downloads = await asyncio.to_thread(download_manager.get_all_downloads)
 
         return {
             "downloads": [
@@ -328,7 +331,7 @@ async def get_download_info(download_id: str):
         raise HTTPException(status_code=503, detail="Download manager not available")
 
     try:
-        info = download_manager.get_download_info(download_id)
+        info = await asyncio.to_thread(download_manager.get_download_info, download_id)
 
         if not info:
             raise HTTPException(status_code=404, detail="Download not found")
@@ -369,12 +372,14 @@ async def delete_download(download_id: str):
 
     try:
         # Check if download exists
-        info = download_manager.get_download_info(download_id)
+        info = await asyncio.to_thread(download_manager.get_download_info, download_id)
         if not info:
             raise HTTPException(status_code=404, detail="Download not found")
 
         # Remove download (keep files)
-        success = download_manager.remove_download(download_id, delete_files=False)
+        success = await asyncio.to_thread(
+            download_manager.remove_download, download_id, delete_files=False
+        )
 
         if not success:
             raise HTTPException(status_code=500, detail="Failed to delete download")
@@ -401,6 +406,8 @@ async def websocket_search(websocket: WebSocket):
     Client sends: {"query": "artist name", "format_filter": "FLAC", "min_seeders": 1, "limit": 50}
     Server sends:
         - Progress: {"type": "progress", "percent": 50, "message": "Searching..."}
+        - Partial: {"type": "partial", "data": {"results": [...]}} (unranked
+          sources, once per source as soon as it answers)
         - Result: {"type": "result", "data": {...}}
         - Error: {"type": "error", "message": "..."}
     """
@@ -435,13 +442,22 @@ async def websocket_search(websocket: WebSocket):
                 "message": message
             })
 
-        # Execute search with progress updates
+        # Partial results callback
+        async def send_partial(sources):
+            await websocket.send_json({
+                "type": "partial",
+                "data": {"results": [s.to_dict() for s in sources]}
+            })
+
+        # Execute search with progress updates, streaming each source's
+        # results before the final ranked list
         result = await search_service.search(
             query=query,
             format_filter=format_filter,
             min_seeders=min_seeders,
             limit=limit,
-            progress_callback=send_progress
+            progress_callback=send_progress,
+            results_callback=send_partial
         )
 
         # Convert to response format
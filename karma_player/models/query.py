@@ -6,7 +6,7 @@ from typing import Optional, List, Literal
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class MusicQuery:
     """
     SQL-like structured music query
@@ -119,7 +119,7 @@ class MusicQuery:
         return query
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryIntent:
     """
     User's search intent parsed by AI
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Optional, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedQuery:
     """Parsed user query from AI"""
     artist: Optional[str]
@@ -16,7 +16,7 @@ class ParsedQuery:
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class MBResult:
     """MusicBrainz search result"""
     mbid: str
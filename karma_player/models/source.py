@@ -1,12 +1,16 @@
 """
 Unified music source models for torrents, streams, and local files
 """
+import hashlib
 import re
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List
 
+_INFOHASH_RE = re.compile(r"xt=urn:btih:([a-fA-F0-9]+)")
+
 
 class SourceType(Enum):
     """Type of music source"""
@@ -53,7 +57,6 @@ class MusicSource:
     format: Optional[str] = None  # FLAC, MP3, M4A, OPUS
     source_type: SourceType = SourceType.TORRENT
     url: str = ""
-    quality_score: float = 0.0
     indexer: str = "unknown"
 
     # Torrent-specific fields
@@ -79,21 +82,20 @@ class MusicSource:
         elif self.url and not self.magnet_link and self.source_type == SourceType.TORRENT:
             self.magnet_link = self.url
 
-        # Auto-calculate quality score if not provided
-        if self.quality_score == 0.0:
-            self.quality_score = self.calculate_quality_score()
+        # Formats are compared uppercase everywhere; normalize once here
+        if self.format:
+            self.format = self.format.upper()
 
     @property
     def infohash(self) -> str:
         """Extract infohash from magnet link or generate ID hash"""
         if self.source_type == SourceType.TORRENT and self.url:
-            match = re.search(r"xt=urn:btih:([a-fA-F0-9]+)", self.url)
+            match = _INFOHASH_RE.search(self.url)
             if match:
                 return match.group(1).lower()
 
             # For Jackett/download URLs, use URL hash as identifier
             if not self.url.startswith("magnet:"):
-                import hashlib
                 return hashlib.sha1(self.url.encode()).hexdigest()[:40].lower()
 
         return self.id
@@ -111,6 +113,15 @@ class MusicSource:
         mb = self.size_bytes / (1024**2)
         return f"{mb:.2f} MB"
 
+    @cached_property
+    def quality_score(self) -> float:
+        """Quality score, computed on first access.
+
+        Results dropped by dedup/filters never pay for scoring. Assigning
+        to it overrides the computed value.
+        """
+        return self.calculate_quality_score()
+
     def calculate_quality_score(self) -> float:
         """
         Calculate unified quality score (0-1000 scale)
@@ -161,9 +172,7 @@ class MusicSource:
         if not self.format:
             return 80  # Default for unknown format
 
-        format_upper = self.format.upper()
-
-        if format_upper == "FLAC":
+        if self.format == "FLAC":
             format_bonus = 200
 
             # Hi-res audio bonus
@@ -182,7 +191,7 @@ class MusicSource:
                          ["16/192", "16/96", "16/88"]):
                     format_bonus += 30
 
-        elif format_upper == "ALAC":
+        elif self.format == "ALAC":
             format_bonus = 190
         elif self.bitrate and "320" in self.bitrate:
             format_bonus = 150
@@ -198,16 +207,15 @@ class MusicSource:
     def _calculate_streaming_codec_bonus(self) -> float:
         """Calculate codec/format bonus for streaming sources"""
         if self.format:
-            format_upper = self.format.upper()
-            if format_upper == "FLAC":
+            if self.format == "FLAC":
                 return 200
-            elif format_upper == "OPUS":
+            elif self.format == "OPUS":
                 return 160
-            elif format_upper in ["AAC", "M4A"]:
+            elif self.format in ["AAC", "M4A"]:
                 return 140
-            elif format_upper == "VORBIS":
+            elif self.format == "VORBIS":
                 return 120
-            elif format_upper == "MP3":
+            elif self.format == "MP3":
                 return 100
 
         # Fallback to codec if format not specified
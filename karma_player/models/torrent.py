@@ -1,11 +1,14 @@
 """
 Torrent-related data models
 """
+import hashlib
 import re
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List
 
+_INFOHASH_RE = re.compile(r"xt=urn:btih:([a-fA-F0-9]+)")
+
 
 @dataclass
 class TorrentResult:
@@ -24,13 +27,12 @@ class TorrentResult:
     @property
     def infohash(self) -> str:
         """Extract infohash from magnet link"""
-        match = re.search(r"xt=urn:btih:([a-fA-F0-9]+)", self.magnet_link)
+        match = _INFOHASH_RE.search(self.magnet_link)
         if match:
             return match.group(1).lower()
 
         # For Jackett/download URLs, use URL hash as identifier
         if self.magnet_link and not self.magnet_link.startswith("magnet:"):
-            import hashlib
             return hashlib.sha1(self.magnet_link.encode()).hexdigest()[:40].lower()
 
         return ""
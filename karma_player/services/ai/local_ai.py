@@ -4,16 +4,40 @@ Falls back to direct API calls when Community API is not available
 """
 import os
 import json
+import importlib.util
 from typing import List, Dict, Any
 
-try:
-    from litellm import completion
-    LITELLM_AVAILABLE = True
-except ImportError:
-    LITELLM_AVAILABLE = False
+# litellm is slow to import, so only check that it is installed here and
+# import it when a client is actually created
+LITELLM_AVAILABLE = importlib.util.find_spec("litellm") is not None
 
 from karma_player.models.search import ParsedQuery, MBResult
 from karma_player.models.torrent import TorrentResult, RankedResult
+from karma_player.services.search.metadata import seeder_tags
+
+
+# Static instructions for parse_query. Kept constant so the user query is the
+# only per-call content (and providers can reuse the cached prompt prefix).
+PARSE_QUERY_SYSTEM_PROMPT = """Parse music search queries into structured data.
+Extract: artist, album, track (song name), year, and determine query_type (album/track/artist).
+
+Return ONLY a JSON object with this exact structure (no markdown, no explanation):
+{
+    "artist": "artist name or null",
+    "album": "album name or null",
+    "track": "track name or null",
+    "year": year_number or null,
+    "query_type": "album" or "track" or "artist",
+    "confidence": 0.0 to 1.0
+}
+
+Examples:
+Query: "radiohead ok computer"
+{"artist": "Radiohead", "album": "OK Computer", "track": null, "year": null, "query_type": "album", "confidence": 0.95}
+
+Query: "paranoid android"
+{"artist": null, "album": null, "track": "Paranoid Android", "year": null, "query_type": "track", "confidence": 0.8}
+"""
 
 
 class LocalAIClient:
@@ -28,6 +52,9 @@ class LocalAIClient:
                 "litellm not available. Install with: poetry add litellm"
             )
 
+        from litellm import acompletion
+        self._acompletion = acompletion
+
         self.provider = provider
         self.model = model or self._get_default_model(provider)
 
@@ -61,34 +88,12 @@ class LocalAIClient:
         """
         Parse natural language query into structured data using AI
         """
-        prompt = f"""Parse this music search query into structured data.
-Extract: artist, album, track (song name), year, and determine query_type (album/track/artist).
-
-Query: "{query}"
-
-Return ONLY a JSON object with this exact structure (no markdown, no explanation):
-{{
-    "artist": "artist name or null",
-    "album": "album name or null",
-    "track": "track name or null",
-    "year": year_number or null,
-    "query_type": "album" or "track" or "artist",
-    "confidence": 0.0 to 1.0
-}}
-
-Examples:
-Query: "radiohead ok computer"
-{{"artist": "Radiohead", "album": "OK Computer", "track": null, "year": null, "query_type": "album", "confidence": 0.95}}
-
-Query: "paranoid android"
-{{"artist": null, "album": null, "track": "Paranoid Android", "year": null, "query_type": "track", "confidence": 0.8}}
-
-Now parse: "{query}"
-"""
-
-        response = completion(
+        response = await self._acompletion(
             model=self.model,
-            messages=[{"role": "user", "content": prompt}],
+            messages=[
+                {"role": "system", "content": PARSE_QUERY_SYSTEM_PROMPT},
+                {"role": "user", "content": query},
+            ],
             temperature=0.3,
         )
 
@@ -201,10 +206,6 @@ Now parse: "{query}"
         if torrent.format == "FLAC":
             tags.append("lossless")
 
-        if torrent.seeders >= 10:
-            tags.append("fast")
-
-        if torrent.seeders >= 50:
-            tags.append("popular")
+        tags.extend(seeder_tags(torrent.seeders))
 
         return tags
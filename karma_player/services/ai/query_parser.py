@@ -2,10 +2,18 @@
 Query parser for SQL-like music search syntax
 """
 import re
+from functools import lru_cache
 from typing import Optional
 from karma_player.models.query import MusicQuery
 
 
+@lru_cache(maxsize=1)
+def _get_openai_cls():
+    """Import the OpenAI async client on first use (the SDK is slow to import)"""
+    from openai import AsyncOpenAI
+    return AsyncOpenAI
+
+
 class SQLLikeParser:
     """
     Parse SQL-like music queries
@@ -18,15 +26,18 @@ class SQLLikeParser:
 
     # Regex patterns
     SELECT_PATTERN = re.compile(r'SELECT\s+(album|track|artist|compilation)', re.IGNORECASE)
-    WHERE_PATTERN = re.compile(r'WHERE\s+(.+?)(?:\s+ORDER\s+BY|\s+LIMIT|$)', re.IGNORECASE)
+    WHERE_PATTERN = re.compile(r'WHERE\s+(.+?)(?:\s+ORDER\s+BY|\s+LIMIT\s+\d|$)', re.IGNORECASE)
     ORDER_PATTERN = re.compile(r'ORDER\s+BY\s+(\w+)(?:\s+(ASC|DESC))?', re.IGNORECASE)
     LIMIT_PATTERN = re.compile(r'LIMIT\s+(\d+)(?:\s+OFFSET\s+(\d+))?', re.IGNORECASE)
 
-    # WHERE clause patterns
-    EQUALS_PATTERN = re.compile(r'(\w+)\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
-    NUMBER_PATTERN = re.compile(r'(\w+)\s*=\s*(\d+)', re.IGNORECASE)
-    RANGE_PATTERN = re.compile(r'(\w+)\s+BETWEEN\s+(\d+)\s+AND\s+(\d+)', re.IGNORECASE)
-    COMPARISON_PATTERN = re.compile(r'(\w+)\s*([><=]+)\s*(\d+)', re.IGNORECASE)
+    # WHERE clause condition: one ordered alternation, so each condition is
+    # matched exactly once (range, then quoted string, then numeric comparison)
+    CONDITION_PATTERN = re.compile(
+        r'(?P<range_field>\w+)\s+BETWEEN\s+(?P<range_min>\d+)\s+AND\s+(?P<range_max>\d+)'
+        r'|(?P<str_field>\w+)\s*=\s*["\'](?P<str_value>[^"\']+)["\']'
+        r'|(?P<num_field>\w+)\s*(?P<num_op>[><=]+)\s*(?P<num_value>\d+)',
+        re.IGNORECASE
+    )
 
     @staticmethod
     def parse(query_str: str) -> Optional[MusicQuery]:
@@ -93,59 +104,53 @@ class SQLLikeParser:
     def _parse_where_clause(where_clause: str, query: MusicQuery):
         """Parse WHERE clause and populate query object"""
 
-        # String equality (artist="Radiohead")
-        for match in SQLLikeParser.EQUALS_PATTERN.finditer(where_clause):
-            field, value = match.groups()
-            field = field.lower()
-
-            if field in ["artist", "name"]:
-                query.artist = value
-            elif field in ["album", "release"]:
-                query.album = value
-            elif field in ["track", "title", "song"]:
-                query.track = value
-            elif field == "format":
-                query.format = value.upper()
-            elif field == "bitrate":
-                query.bitrate = value
-            elif field == "source":
-                query.source = value.upper()
-            elif field == "country":
-                query.country = value
-            elif field == "label":
-                query.label = value
-
-        # Numeric equality (year=1997)
-        for match in SQLLikeParser.NUMBER_PATTERN.finditer(where_clause):
-            field, value = match.groups()
-            field = field.lower()
-            value = int(value)
-
-            if field == "year":
-                query.year = value
-            elif field == "limit":
-                query.limit = value
-
-        # Ranges (year BETWEEN 1990 AND 2000)
-        for match in SQLLikeParser.RANGE_PATTERN.finditer(where_clause):
-            field, min_val, max_val = match.groups()
-            field = field.lower()
-
-            if field == "year":
-                query.year_range = (int(min_val), int(max_val))
-
-        # Comparisons (seeders>=10)
-        for match in SQLLikeParser.COMPARISON_PATTERN.finditer(where_clause):
-            field, operator, value = match.groups()
-            field = field.lower()
-            value = int(value)
-
-            if field in ["seeders", "seeds"] and operator == ">=":
-                query.min_seeders = value
-            elif field == "size" and operator == ">=":
-                query.min_size_mb = value
-            elif field == "size" and operator == "<=":
-                query.max_size_mb = value
+        for match in SQLLikeParser.CONDITION_PATTERN.finditer(where_clause):
+            if match.group("range_field"):
+                # Ranges (year BETWEEN 1990 AND 2000)
+                field = match.group("range_field").lower()
+
+                if field == "year":
+                    query.year_range = (int(match.group("range_min")), int(match.group("range_max")))
+
+            elif match.group("str_field"):
+                # String equality (artist="Radiohead")
+                field = match.group("str_field").lower()
+                value = match.group("str_value")
+
+                if field in ["artist", "name"]:
+                    query.artist = value
+                elif field in ["album", "release"]:
+                    query.album = value
+                elif field in ["track", "title", "song"]:
+                    query.track = value
+                elif field == "format":
+                    query.format = value.upper()
+                elif field == "bitrate":
+                    query.bitrate = value
+                elif field == "source":
+                    query.source = value.upper()
+                elif field == "country":
+                    query.country = value
+                elif field == "label":
+                    query.label = value
+
+            else:
+                # Numeric equality (year=1997) and comparisons (seeders>=10)
+                field = match.group("num_field").lower()
+                operator = match.group("num_op")
+                value = int(match.group("num_value"))
+
+                if operator == "=":
+                    if field == "year":
+                        query.year = value
+                    elif field == "limit":
+                        query.limit = value
+                elif field in ["seeders", "seeds"] and operator == ">=":
+                    query.min_seeders = value
+                elif field == "size" and operator == ">=":
+                    query.min_size_mb = value
+                elif field == "size" and operator == "<=":
+                    query.max_size_mb = value
 
 
 class NaturalLanguageToSQL:
@@ -173,11 +178,10 @@ class NaturalLanguageToSQL:
             # Try AI-powered parsing first
             from karma_player.config import Config
             if Config.OPENAI_API_KEY:
-                from openai import AsyncOpenAI
                 import json
 
                 # Use OpenAI directly
-                client = AsyncOpenAI(api_key=Config.OPENAI_API_KEY)
+                client = _get_openai_cls()(api_key=Config.OPENAI_API_KEY)
 
                 response = await client.chat.completions.create(
                     model="gpt-4o-mini",
@@ -1,19 +1,36 @@
 """
 MusicBrainz service for canonical music metadata
 """
-import musicbrainzngs as mb
+import asyncio
+import logging
+import time
+from collections import OrderedDict
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+
+import aiohttp
 
 from karma_player.models.search import MBResult, ParsedQuery
 from karma_player import __version__
 
+logger = logging.getLogger(__name__)
+
+MB_API_URL = "https://musicbrainz.org/ws/2"
+
 
 class MusicBrainzService:
     """
     Interface to MusicBrainz API for canonical music metadata
+
+    Talks to the JSON web service directly over aiohttp so lookups (and
+    the rate-limit wait between them) never block the event loop.
     """
 
+    RATE_LIMIT_INTERVAL = 1.0  # MusicBrainz allows 1 request/second
+    TIMEOUT = 10  # seconds
+    SEARCH_CACHE_SIZE = 1024
+    SEARCH_CACHE_TTL = 3600  # seconds
+    RELEASE_CACHE_SIZE = 256  # releases by MBID never change, no TTL
+
     def __init__(self, app_name: str = "karma-player", app_version: str = __version__, contact: str = ""):
         """
         Initialize MusicBrainz client
@@ -23,8 +40,59 @@ class MusicBrainzService:
             app_version: Application version
             contact: Contact email (optional but recommended)
         """
-        mb.set_useragent(app_name, app_version, contact)
-        mb.set_rate_limit(True)  # Respect rate limits (1 request/second)
+        self.user_agent = f"{app_name}/{app_version}"
+        if contact:
+            self.user_agent += f" ( {contact} )"
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._rate_lock = asyncio.Lock()
+        self._next_request_at = 0.0
+
+        self._search_cache: "OrderedDict[tuple, tuple[float, List[MBResult]]]" = OrderedDict()
+        self._release_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={"User-Agent": self.user_agent, "Accept": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=self.TIMEOUT),
+            )
+        return self._session
+
+    async def _wait_for_rate_limit(self):
+        """Space requests RATE_LIMIT_INTERVAL apart without blocking the loop."""
+        async with self._rate_lock:
+            delay = self._next_request_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_request_at = time.monotonic() + self.RATE_LIMIT_INTERVAL
+
+    async def _get_json(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        GET a web service resource as JSON
+
+        Args:
+            path: Resource path relative to MB_API_URL
+            params: Query parameters
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            aiohttp.ClientError: On network or HTTP errors
+        """
+        await self._wait_for_rate_limit()
+        session = await self._get_session()
+        async with session.get(f"{MB_API_URL}/{path}", params={**params, "fmt": "json"}) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def close(self):
+        """Close the HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def search_release(
         self,
@@ -45,7 +113,35 @@ class MusicBrainzService:
         Returns:
             List of MBResult objects
         """
-        # Build query string
+        query = self._build_release_query(artist, album, year)
+        if not query:
+            return []
+
+        cache_key = self._search_cache_key(artist, album, year, limit)
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            # Search releases
+            result = await self._get_json("release/", {"query": query, "limit": limit})
+
+            mb_results = [self._parse_release(release) for release in result.get('releases', [])]
+            self._store_search(cache_key, mb_results)
+            return list(mb_results)
+
+        except Exception:
+            # MusicBrainz errors (rate limit, network, etc.)
+            logger.warning("MusicBrainz search error", exc_info=True)
+            return []
+
+    @staticmethod
+    def _build_release_query(
+        artist: Optional[str],
+        album: Optional[str],
+        year: Optional[int]
+    ) -> str:
+        """Build a Lucene release query, or "" if there is nothing to search."""
         query_parts = []
 
         if artist:
@@ -55,56 +151,68 @@ class MusicBrainzService:
         if year:
             query_parts.append(f'date:{year}')
 
-        if not query_parts:
-            return []
+        return " AND ".join(query_parts)
+
+    @staticmethod
+    def _search_cache_key(
+        artist: Optional[str],
+        album: Optional[str],
+        year: Optional[int],
+        limit: int
+    ) -> tuple:
+        """Canonical cache key so case/whitespace variants share an entry."""
+        return (
+            artist.strip().casefold() if artist else None,
+            album.strip().casefold() if album else None,
+            year,
+            limit,
+        )
+
+    def _get_cached_search(self, cache_key: tuple) -> Optional[List[MBResult]]:
+        """Return a copy of cached search results, or None if missing/expired."""
+        cached = self._search_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        cached_at, cached_results = cached
+        if time.monotonic() - cached_at >= self.SEARCH_CACHE_TTL:
+            del self._search_cache[cache_key]
+            return None
+
+        self._search_cache.move_to_end(cache_key)
+        return list(cached_results)
 
-        query = " AND ".join(query_parts)
+    def _store_search(self, cache_key: tuple, results: List[MBResult]):
+        """Cache search results, evicting the least recently used entry."""
+        self._search_cache[cache_key] = (time.monotonic(), results)
+        if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
 
+    @staticmethod
+    def _parse_release(release: Dict[str, Any]) -> MBResult:
+        """Convert a release from the web service JSON into an MBResult."""
+        # Primary artist and label are present on almost every release, so
+        # index straight in and fall back only when the lookup fails.
         try:
-            # Search releases
-            result = mb.search_releases(query=query, limit=limit)
-
-            mb_results = []
-            for release in result.get('release-list', []):
-                # Extract artist (primary)
-                artist_name = "Unknown Artist"
-                if 'artist-credit' in release and release['artist-credit']:
-                    artist_name = release['artist-credit'][0]['artist']['name']
-
-                # Extract release date
-                release_date = release.get('date', '')
-
-                # Extract country
-                country = release.get('country', '')
-
-                # Extract label info
-                label = None
-                if 'label-info-list' in release and release['label-info-list']:
-                    label_info = release['label-info-list'][0]
-                    if 'label' in label_info and label_info['label']:
-                        label = label_info['label'].get('name')
-
-                # Extract barcode
-                barcode = release.get('barcode')
-
-                mb_results.append(
-                    MBResult(
-                        mbid=release['id'],
-                        title=release['title'],
-                        artist=artist_name,
-                        release_date=release_date,
-                        country=country,
-                        label=label,
-                        barcode=barcode
-                    )
-                )
-
-            return mb_results
-
-        except Exception as e:
-            # MusicBrainz errors (rate limit, network, etc.)
-            print(f"MusicBrainz search error: {e}")
-            return []
+            artist_name = release['artist-credit'][0]['artist']['name']
+        except (KeyError, IndexError, TypeError):
+            artist_name = "Unknown Artist"
+
+        try:
+            label = release['label-info'][0]['label']['name']
+        except (KeyError, IndexError, TypeError):
+            label = None
+
+        get = release.get
+        return MBResult(
+            mbid=release['id'],
+            title=release['title'],
+            artist=artist_name,
+            release_date=get('date', ''),
+            country=get('country', ''),
+            label=label,
+            barcode=get('barcode')
+        )
 
     async def get_release_by_id(self, mbid: str) -> Optional[Dict[str, Any]]:
         """
@@ -114,16 +222,24 @@ class MusicBrainzService:
             mbid: MusicBrainz release ID
 
         Returns:
-            Release info dict or None
+            Release info dict (MusicBrainz JSON format) or None
         """
+        cached = self._release_cache.get(mbid)
+        if cached is not None:
+            self._release_cache.move_to_end(mbid)
+            return cached
+
         try:
-            result = mb.get_release_by_id(
-                mbid,
-                includes=['artists', 'recordings', 'release-groups', 'labels', 'media']
+            release = await self._get_json(
+                f"release/{mbid}",
+                {"inc": " ".join(['artists', 'recordings', 'release-groups', 'labels', 'media'])}
             )
-            return result.get('release')
-        except Exception as e:
-            print(f"MusicBrainz get release error: {e}")
+            self._release_cache[mbid] = release
+            if len(self._release_cache) > self.RELEASE_CACHE_SIZE:
+                self._release_cache.popitem(last=False)
+            return release
+        except Exception:
+            logger.warning("MusicBrainz get release error", exc_info=True)
             return None
 
     async def search_from_parsed_query(self, query: ParsedQuery, limit: int = 10) -> List[MBResult]:
@@ -168,3 +284,4 @@ class MusicBrainzService:
             parts.append(f"- {mb_result.label}")
 
         return " ".join(parts)
+
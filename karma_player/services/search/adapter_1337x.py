@@ -1,17 +1,263 @@
 """1337x.to torrent indexer adapter."""
 
 import asyncio
+import contextlib
+import hashlib
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import List
+from pathlib import Path
+from typing import List, Optional
 from urllib.parse import quote_plus
 
 import aiohttp
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from karma_player.services.search.source_adapter import SourceAdapter
 from karma_player.models.source import MusicSource, SourceType
-from karma_player.services.search.metadata import MetadataExtractor
+from karma_player.services.search.metadata import extract_all, parse_size
+from karma_player.services.search.page_cache import PageCache
+
+
+# One pass over each info-list <li>; the named group that matched tells
+# which field the item holds.
+_INFO_ITEM_RE = re.compile(
+    r"Seeders.*?(?P<seeders>\d+)"
+    r"|Leechers.*?(?P<leechers>\d+)"
+    r"|(?:Total size|Size).*?(?P<size>[\d,\.]+\s*(?i:[KMGT]?B))"
+    r"|(?:Date uploaded|Uploaded).*?(?P<date>\w+\.\s+\d+\w+\s+'\d+)",
+    re.DOTALL,
+)
+_BTIH_PREFIX = "xt=urn:btih:"
+
+# Upload dates look like "Jan. 1st '24": abbreviated month, ordinal day,
+# two-digit year.
+_UPLOAD_DATE_RE = re.compile(
+    r"(?P<month>[A-Za-z]+)\.?\s+(?P<day>\d{1,2})(?:st|nd|rd|th)?\s+'(?P<year>\d{2})"
+)
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+         "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+        start=1,
+    )
+}
+
+# Detail pages are parsed off the event loop; cap parser threads so a burst
+# of searches doesn't spawn one thread per page.
+_PARSE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="1337x-parse")
+
+# Second link in the coll-1 cell of a row inside table.table-list > tbody,
+# resolved in one libxml2 call per row.
+_ROW_DETAIL_XPATH = etree.XPath(
+    '(self::tr[parent::tbody/parent::table[contains(concat(" ", normalize-space(@class), " "), " table-list ")]]'
+    '/td[contains(concat(" ", normalize-space(@class), " "), " coll-1 ")][1]//a)[2]/@href'
+)
+
+_TEXT_TAGS = frozenset({"h1", "li"})
+# Only these tags produce parser events; the rest of the page is never
+# surfaced to Python.
+_DETAIL_EVENT_TAGS = ("a", "h1", "li")
+_FEED_CHUNK_SIZE = 16384
+
+
+def _parse_detail_page(html: bytes) -> dict | None:
+    """Extract torrent fields from a 1337x detail page.
+
+    Runs in a worker thread, so it must not touch the event loop.
+
+    Args:
+        html: Raw detail page bytes (1337x always serves UTF-8)
+
+    Returns:
+        Dict with magnet_link, title, seeders, leechers, size_bytes and
+        uploaded_at, or None if the page has no magnet link
+    """
+    magnet_link = None
+    title = None
+    seeders = 0
+    leechers = 0
+    size_bytes = 0
+    uploaded_at = datetime.now(timezone.utc)
+
+    # Number of open <h1>/<li> elements whose text is still needed; once
+    # none are open, everything parsed so far is dropped from the tree.
+    depth = 0
+
+    for event, elem in _iter_parse_events(html):
+        tag = elem.tag
+
+        if event == "start":
+            if tag == "a":
+                href = elem.get("href", "")
+                if magnet_link is None and href.startswith("magnet:?"):
+                    magnet_link = href
+            elif tag in _TEXT_TAGS:
+                depth += 1
+            continue
+
+        if tag not in _TEXT_TAGS:
+            continue
+
+        depth -= 1
+        text = "".join(elem.itertext()).strip()
+
+        if tag == "h1":
+            if title is None:
+                title = text
+        else:
+            seeders, leechers, size_bytes, uploaded_at = _apply_info_item(
+                text, seeders, leechers, size_bytes, uploaded_at
+            )
+
+        if depth == 0:
+            _discard_parsed(elem)
+
+    if not magnet_link:
+        return None
+
+    return {
+        "magnet_link": magnet_link,
+        "title": title or "Unknown",
+        "seeders": seeders,
+        "leechers": leechers,
+        "size_bytes": size_bytes,
+        "uploaded_at": uploaded_at,
+    }
+
+
+def _discard_parsed(elem):
+    """Free elem and every element that closed before it."""
+    elem.clear(keep_tail=True)
+    for node in (elem, *elem.iterancestors()):
+        parent = node.getparent()
+        while node.getprevious() is not None:
+            del parent[0]
+
+
+def _iter_parse_events(html: bytes):
+    """Yield (event, element) pairs for the detail tags while feeding html."""
+    parser = etree.HTMLPullParser(
+        events=("start", "end"), tag=_DETAIL_EVENT_TAGS, encoding="utf-8"
+    )
+    for offset in range(0, len(html), _FEED_CHUNK_SIZE):
+        parser.feed(html[offset:offset + _FEED_CHUNK_SIZE])
+        yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+def _apply_info_item(
+    text: str, seeders: int, leechers: int, size_bytes: int, uploaded_at: datetime
+) -> tuple[int, int, int, datetime]:
+    """Update detail fields from the text of one info-list <li>."""
+    match = _INFO_ITEM_RE.search(text)
+    if match is None:
+        return seeders, leechers, size_bytes, uploaded_at
+
+    field = match.lastgroup
+    value = match.group(field)
+
+    if field == "seeders":
+        seeders = int(value)
+    elif field == "leechers":
+        leechers = int(value)
+    elif field == "size":
+        size_bytes = parse_size(value)
+    elif field == "date":
+        uploaded_at = _parse_upload_date(value) or uploaded_at
+
+    return seeders, leechers, size_bytes, uploaded_at
+
+
+def _parse_upload_date(value: str) -> datetime | None:
+    """Parse a 1337x upload date such as "Jan. 1st '24" (always UTC).
+
+    Returns None for anything that doesn't look like that format.
+    """
+    match = _UPLOAD_DATE_RE.fullmatch(value.strip())
+    if match is None:
+        return None
+
+    month = _MONTHS.get(match["month"][:3].title())
+    if month is None:
+        return None
+
+    try:
+        return datetime(
+            2000 + int(match["year"]), month, int(match["day"]), tzinfo=timezone.utc
+        )
+    except ValueError:
+        return None
+
+
+def _row_detail_path(row) -> str | None:
+    """Return the detail page path of a search result row.
+
+    Only rows in the ``table-list`` results table count; the second link
+    in the ``coll-1`` cell points at the torrent page.
+    """
+    hrefs = _ROW_DETAIL_XPATH(row)
+    return str(hrefs[0]) if hrefs else None
+
+
+def default_cache_path() -> Path:
+    """Return the default 1337x page cache file."""
+    from karma_player.config import Config
+    return Config.get_config_directory() / "cache" / "1337x.sqlite3"
+
+
+async def fetch_detail_page(
+    session: aiohttp.ClientSession,
+    detail_url: str,
+    timeout: float,
+    cache: Optional[PageCache] = None,
+    cache_ttl: float = 86400,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> dict | None:
+    """Fetch and parse a 1337x detail page.
+
+    Parsed pages are kept in the page cache, so a page is downloaded and
+    parsed once until its entry expires.
+
+    Args:
+        session: aiohttp session
+        detail_url: URL of detail page
+        timeout: Request timeout in seconds
+        cache: Optional page cache checked before fetching
+        cache_ttl: Seconds to keep a parsed page in the cache
+        semaphore: Optional limit on concurrent page downloads
+
+    Returns:
+        Dict from _parse_detail_page, or None if the page could not be used
+    """
+    key = f"detail:{detail_url}"
+    if cache is not None:
+        details = await asyncio.to_thread(cache.get, key)
+        if details is not None:
+            details["uploaded_at"] = datetime.fromisoformat(details["uploaded_at"])
+            return details
+
+    async with semaphore or contextlib.nullcontext():
+        async with asyncio.timeout(timeout):
+            async with session.get(detail_url) as response:
+                if response.status != 200:
+                    return None
+
+                html = await response.read()
+
+    loop = asyncio.get_running_loop()
+    details = await loop.run_in_executor(_PARSE_EXECUTOR, _parse_detail_page, html)
+
+    if details is not None and cache is not None:
+        await asyncio.to_thread(
+            cache.set,
+            key,
+            {**details, "uploaded_at": details["uploaded_at"].isoformat()},
+            cache_ttl,
+        )
+    return details
 
 
 class Adapter1337x(SourceAdapter):
@@ -20,6 +266,25 @@ class Adapter1337x(SourceAdapter):
     BASE_URL = "https://1337x.to"
     SEARCH_URL = f"{BASE_URL}/search"
     TIMEOUT = 10  # seconds
+    MAX_RESULTS = 20  # detail pages fetched per search
+    MAX_CONCURRENT_DETAILS = 6  # detail page downloads in flight at once
+    DETAIL_CACHE_TTL = 86400  # parsed detail pages, 24 hours
+    SEARCH_CACHE_TTL = 3600  # detail URLs per query, 1 hour
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    }
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        """Initialize adapter.
+
+        Args:
+            cache_path: SQLite file for cached pages (defaults to the
+                config directory)
+        """
+        super().__init__()
+        self._session: aiohttp.ClientSession | None = None
+        self._detail_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DETAILS)
+        self._cache = PageCache(cache_path or default_cache_path())
 
     @property
     def name(self) -> str:
@@ -40,163 +305,156 @@ class Adapter1337x(SourceAdapter):
         Returns:
             List of MusicSource objects
         """
+        tasks: list[asyncio.Task] = []
+        detail_urls: list[str] = []
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            }
-            async with aiohttp.ClientSession(headers=headers) as session:
-                # Search for torrents
-                search_url = f"{self.SEARCH_URL}/{quote_plus(query)}/1/"
-
-                async with asyncio.timeout(self.TIMEOUT):
-                    async with session.get(search_url) as response:
-                        if response.status != 200:
-                            self._update_health(success=False)
-                            return []
-
-                        html = await response.text()
-
-                # Parse search results
-                soup = BeautifulSoup(html, "html.parser")
-                table = soup.find("table", class_="table-list")
-
-                if not table:
-                    self._update_health(success=True)
-                    return []
-
-                rows = table.find("tbody").find_all("tr") if table.find("tbody") else []
-
-                # Extract torrent details from rows
-                detail_urls = []
-                for row in rows[:20]:  # Top 20 results
-                    try:
-                        # Get detail page URL
-                        link_cell = row.find("td", class_="coll-1")
-                        if not link_cell:
-                            continue
-
-                        links = link_cell.find_all("a")
-                        if len(links) < 2:
-                            continue
-
-                        detail_path = links[1].get("href")
-                        if detail_path:
-                            detail_urls.append(f"{self.BASE_URL}{detail_path}")
-                    except (AttributeError, IndexError):
-                        continue
-
-                # Fetch detail pages in parallel to get magnet links
-                results = []
-                if detail_urls:
-                    tasks = [
-                        self._fetch_torrent_details(session, url, html)
-                        for url in detail_urls
-                    ]
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                    # Filter out None and exceptions
-                    results = [r for r in results if isinstance(r, MusicSource)]
-
-                self._update_health(success=True)
-                return results
+            session = await self._get_session()
+
+            cached_urls = await asyncio.to_thread(self._cache.get, f"search:{query}")
+            if cached_urls is not None:
+                tasks = [
+                    asyncio.create_task(self._fetch_torrent_details(session, url))
+                    for url in cached_urls
+                ]
+                return await self._collect_results(tasks)
+
+            # Search for torrents
+            search_url = f"{self.SEARCH_URL}/{quote_plus(query)}/1/"
+
+            # Parse result rows while the page is still downloading and start
+            # each detail fetch as soon as its row has been seen.
+            parser = etree.HTMLPullParser(events=("end",), tag="tr", encoding="utf-8")
+
+            async with asyncio.timeout(self.TIMEOUT):
+                async with session.get(search_url) as response:
+                    if response.status != 200:
+                        self._update_health(success=False)
+                        return []
+
+                    async for chunk in response.content.iter_chunked(_FEED_CHUNK_SIZE):
+                        parser.feed(chunk)
+                        self._schedule_detail_fetches(parser, session, tasks, detail_urls)
+                        if len(tasks) >= self.MAX_RESULTS:
+                            break
+
+            if len(tasks) < self.MAX_RESULTS:
+                parser.close()
+                self._schedule_detail_fetches(parser, session, tasks, detail_urls)
+
+            if detail_urls:
+                await asyncio.to_thread(
+                    self._cache.set, f"search:{query}", detail_urls, self.SEARCH_CACHE_TTL
+                )
+            return await self._collect_results(tasks)
 
         except asyncio.TimeoutError:
+            self._cancel_pending(tasks)
             self._update_health(success=False)
             return []
         except Exception as e:
+            self._cancel_pending(tasks)
             self._update_health(success=False)
             return []
 
+    async def _collect_results(self, tasks: list[asyncio.Task]) -> List[MusicSource]:
+        """Wait for detail fetches and keep the ones that produced a source."""
+        results = []
+        if tasks:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            # Filter out None and exceptions
+            results = [r for r in results if isinstance(r, MusicSource)]
+
+        self._update_health(success=True)
+        return results
+
+    def _schedule_detail_fetches(
+        self,
+        parser: etree.HTMLPullParser,
+        session: aiohttp.ClientSession,
+        tasks: list[asyncio.Task],
+        detail_urls: list[str],
+    ):
+        """Start a detail fetch for every result row the parser has completed."""
+        for _, row in parser.read_events():
+            if len(tasks) >= self.MAX_RESULTS:
+                break
+
+            detail_path = _row_detail_path(row)
+            row.clear()
+            if detail_path:
+                detail_url = f"{self.BASE_URL}{detail_path}"
+                detail_urls.append(detail_url)
+                tasks.append(asyncio.create_task(
+                    self._fetch_torrent_details(session, detail_url)
+                ))
+
+    @staticmethod
+    def _cancel_pending(tasks: list[asyncio.Task]):
+        """Cancel detail fetches left running after the search failed."""
+        for task in tasks:
+            task.cancel()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+
+        Keeping one session alive reuses TCP/TLS connections and the DNS
+        cache across searches and detail-page fetches.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.HEADERS,
+                connector=aiohttp.TCPConnector(
+                    limit=20,
+                    limit_per_host=self.MAX_CONCURRENT_DETAILS,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,
+                ),
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session and the page cache."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._cache.close()
+
     async def _fetch_torrent_details(
-        self, session: aiohttp.ClientSession, detail_url: str, search_html: str
+        self, session: aiohttp.ClientSession, detail_url: str
     ) -> MusicSource | None:
         """Fetch torrent details from detail page.
 
         Args:
             session: aiohttp session
             detail_url: URL of detail page
-            search_html: HTML from search page (for extracting metadata)
 
         Returns:
             MusicSource or None if failed
         """
         try:
-            async with asyncio.timeout(self.TIMEOUT):
-                async with session.get(detail_url) as response:
-                    if response.status != 200:
-                        return None
-
-                    html = await response.text()
-
-            soup = BeautifulSoup(html, "html.parser")
-
-            # Extract magnet link
-            magnet_link = None
-            magnet_tag = soup.find("a", href=re.compile(r"^magnet:\?"))
-            if magnet_tag:
-                magnet_link = magnet_tag.get("href")
-
-            if not magnet_link:
+            details = await fetch_detail_page(
+                session,
+                detail_url,
+                self.TIMEOUT,
+                self._cache,
+                self.DETAIL_CACHE_TTL,
+                self._detail_semaphore,
+            )
+            if details is None:
                 return None
 
-            # Extract title
-            title_tag = soup.find("h1")
-            title = title_tag.text.strip() if title_tag else "Unknown"
-
-            # Extract metadata from info list
-            info_items = soup.find_all("li")
-            seeders = 0
-            leechers = 0
-            size_bytes = 0
-            uploaded_at = datetime.now(timezone.utc)
-
-            for item in info_items:
-                text = item.get_text(strip=True)
-
-                # Seeders
-                if "Seeders" in text:
-                    try:
-                        seeders = int(re.search(r"\d+", text).group())
-                    except (AttributeError, ValueError):
-                        pass
-
-                # Leechers
-                elif "Leechers" in text:
-                    try:
-                        leechers = int(re.search(r"\d+", text).group())
-                    except (AttributeError, ValueError):
-                        pass
-
-                # Size
-                elif "Total size" in text or "Size" in text:
-                    size_match = re.search(r"([\d,\.]+\s*[KMGT]?B)", text, re.IGNORECASE)
-                    if size_match:
-                        size_bytes = MetadataExtractor.parse_size(size_match.group(1))
-
-                # Date
-                elif "Date uploaded" in text or "Uploaded" in text:
-                    # Try to parse date (1337x uses various formats)
-                    date_match = re.search(r"(\w+\.\s+\d+\w+\s+'\d+)", text)
-                    if date_match:
-                        try:
-                            # Parse dates like "Jan. 1st '24"
-                            date_str = date_match.group(1)
-                            # Simplified: just use current time for now
-                            uploaded_at = datetime.now(timezone.utc)
-                        except:
-                            pass
+            title = details["title"]
+            magnet_link = details["magnet_link"]
 
             # Extract format, bitrate, source from title
-            extractor = MetadataExtractor()
-            format_type = extractor.extract_format(title)
-            bitrate = extractor.extract_bitrate(title)
-            source = extractor.extract_source(title)
+            format_type, bitrate, source = extract_all(title)
 
             # Generate infohash for ID
-            import hashlib
-            match = re.search(r"xt=urn:btih:([a-fA-F0-9]+)", magnet_link)
-            if match:
-                infohash = match.group(1).lower()
+            idx = magnet_link.find(_BTIH_PREFIX)
+            if idx != -1:
+                start = idx + len(_BTIH_PREFIX)
+                infohash = magnet_link[start:].partition("&")[0].lower()
             else:
                 infohash = hashlib.sha1(magnet_link.encode()).hexdigest()[:40].lower()
 
@@ -207,10 +465,10 @@ class Adapter1337x(SourceAdapter):
                 source_type=SourceType.TORRENT,
                 url=magnet_link,
                 indexer=self.name,
-                seeders=seeders,
-                leechers=leechers,
-                size_bytes=size_bytes,
-                uploaded_at=uploaded_at,
+                seeders=details["seeders"],
+                leechers=details["leechers"],
+                size_bytes=details["size_bytes"],
+                uploaded_at=details["uploaded_at"],
                 bitrate=bitrate,
                 magnet_link=magnet_link,  # Backward compatibility
             )
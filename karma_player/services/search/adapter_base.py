@@ -1,7 +1,7 @@
 """Base adapter interface for torrent indexers."""
 
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
 from typing import List
 
 from karma_player.models.torrent import TorrentResult
@@ -13,7 +13,7 @@ class IndexerAdapter(ABC):
     def __init__(self):
         """Initialize adapter with health tracking."""
         self._consecutive_failures = 0
-        self._last_success = datetime.now(timezone.utc).timestamp()
+        self._last_success = time.time()
         self._last_failure = 0.0
         self._circuit_breaker_threshold = 3
         self._cooldown_seconds = 300  # 5 minutes
@@ -38,7 +38,7 @@ class IndexerAdapter(ABC):
         # Circuit breaker open
         if self._consecutive_failures >= self._circuit_breaker_threshold:
             # Check if cooldown expired
-            time_since_failure = datetime.now(timezone.utc).timestamp() - self._last_failure
+            time_since_failure = time.time() - self._last_failure
             if time_since_failure < self._cooldown_seconds:
                 return False
             # Cooldown expired, reset and allow retry
@@ -70,7 +70,7 @@ class IndexerAdapter(ABC):
         """
         if success:
             self._consecutive_failures = 0
-            self._last_success = datetime.now(timezone.utc).timestamp()
+            self._last_success = time.time()
         else:
             self._consecutive_failures += 1
-            self._last_failure = datetime.now(timezone.utc).timestamp()
+            self._last_failure = time.time()
@@ -1,19 +1,66 @@
 """Jackett torrent indexer adapter."""
 
 import asyncio
-import xml.etree.ElementTree as ET
+import hashlib
+import importlib.util
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
 from typing import List, Optional
 from urllib.parse import quote_plus
 
-import aiohttp
+import httpx
+from lxml import etree
 
 from karma_player.services.search.source_adapter import SourceAdapter
 from karma_player.models.source import MusicSource, SourceType
-from karma_player.services.search.metadata import MetadataExtractor
+from karma_player.services.search.metadata import extract_all
 from karma_player import __version__
 
 
+TORZNAB_NS = "http://torznab.com/schemas/2015/feed"
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); without it the
+# client stays on pooled HTTP/1.1 keep-alive connections.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Matches every torznab:* element, so they can be renamed to plain
+# local names ("attr") before lookup.
+_TORZNAB_ANY_TAG = f"{{{TORZNAB_NS}}}*"
+
+_INFOHASH_RE = re.compile(r"xt=urn:btih:([a-fA-F0-9]+)")
+
+# Loose format hints for generic audio categories; the group name is the
+# format. Substring matches on purpose ("320kbps", "flac24").
+_FORMAT_HINT_RE = re.compile(
+    r"(?P<FLAC>flac|24-?bit)|(?P<MP3>mp3|320k|cbr)|(?P<AAC>aac)", re.IGNORECASE
+)
+_FORMAT_HINT_PRIORITY = ("FLAC", "MP3", "AAC")
+
+# Formats implied by a specific Torznab category
+_CATEGORY_FORMAT = {
+    3040: "FLAC",  # Audio/Lossless
+    3010: "MP3",  # Audio/MP3
+    3030: "AAC",  # Audio/Audiobook (common audiobook format)
+}
+# Audio (general/other): fall back to title hints
+_CATEGORY_GENERIC = frozenset({3000, 3050})
+
+def _format_from_title_hints(title: str) -> Optional[str]:
+    """Guess the format from hints anywhere in the title in one scan.
+
+    FLAC hints win over MP3 hints, which win over AAC.
+    """
+    hints = {match.lastgroup for match in _FORMAT_HINT_RE.finditer(title)}
+    for format_type in _FORMAT_HINT_PRIORITY:
+        if format_type in hints:
+            return format_type
+    return None
+
+
 class AdapterJackett(SourceAdapter):
     """Adapter for Jackett proxy (supports 100+ indexers)."""
 
@@ -26,6 +73,12 @@ class AdapterJackett(SourceAdapter):
         3040,  # Audio/Lossless (FLAC, ALAC, APE, etc.)
         3050,  # Audio/Other
     ]
+    # Torznab parent categories include their subcategories, so the full
+    # audio set above is requested as just its parent.
+    AUDIO_PARENT_CATEGORY = 3000
+
+    SEARCH_CACHE_SIZE = 128
+    SEARCH_CACHE_TTL = 300  # seconds
 
     def __init__(
         self,
@@ -47,7 +100,12 @@ class AdapterJackett(SourceAdapter):
         self.api_key = api_key
         self.indexer_id = indexer_id
         self.categories = categories if categories is not None else self.DEFAULT_AUDIO_CATEGORIES
+        self._url = f"{self.base_url}/api/v2.0/indexers/{self.indexer_id}/results/torznab/api"
+        self._cat_param = self._build_cat_param(self.categories)
         self.timeout = 15  # Jackett queries multiple indexers
+        self._client: httpx.AsyncClient | None = None
+        self._client_lock = asyncio.Lock()
+        self._search_cache: "OrderedDict[tuple, tuple[float, List[MusicSource]]]" = OrderedDict()
 
     @property
     def name(self) -> str:
@@ -72,48 +130,44 @@ class AdapterJackett(SourceAdapter):
             # No API key configured, return empty
             return []
 
+        cache_key = (self.indexer_id, query, tuple(self.categories))
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            return cached
+
         # Retry logic for remote/sleeping instances (Easypanel cold starts)
         max_retries = 2 if "localhost" not in self.base_url else 1
         retry_delay = 3  # seconds
 
         for attempt in range(max_retries):
             try:
-                # Torznab API endpoint
-                url = f"{self.base_url}/api/v2.0/indexers/{self.indexer_id}/results/torznab/api"
-
-                # Build category parameter (comma-separated)
-                cat_param = ",".join(str(c) for c in self.categories)
-
                 params = {
                     "apikey": self.api_key,
                     "t": "search",  # Generic search (was "music" - too restrictive)
                     "q": query,
-                    "cat": cat_param,  # Include ALL audio categories
-                }
-
-                headers = {
-                    "User-Agent": f"karma-player/{__version__}"
+                    "cat": self._cat_param,
                 }
 
-                timeout = aiohttp.ClientTimeout(total=self.timeout)
-                async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
-                    async with session.get(url, params=params) as response:
-                        if response.status != 200:
-                            if attempt < max_retries - 1:
-                                # Wait and retry (might be cold start)
-                                await asyncio.sleep(retry_delay)
-                                continue
-                            self._update_health(success=False)
-                            return []
+                client = await self._get_client()
+                response = await client.get(self._url, params=params)
+                if response.status_code != 200:
+                    if attempt < max_retries - 1:
+                        # Wait and retry (might be cold start)
+                        await asyncio.sleep(retry_delay)
+                        continue
+                    self._update_health(success=False)
+                    return []
 
-                        xml_text = await response.text()
+                # Raw bytes: lxml honors the document's own encoding
+                xml_data = response.content
 
                 # Parse Torznab XML response
-                results = self._parse_torznab_xml(xml_text)
+                results = self._parse_torznab_xml(xml_data)
                 self._update_health(success=True)
+                self._store_search(cache_key, results)
                 return results
 
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            except (httpx.HTTPError, asyncio.TimeoutError) as e:
                 if attempt < max_retries - 1:
                     # Timeout or connection error - might be cold start, retry
                     await asyncio.sleep(retry_delay)
@@ -132,145 +186,240 @@ class AdapterJackett(SourceAdapter):
         self._update_health(success=False)
         return []
 
-    def _parse_torznab_xml(self, xml_text: str) -> List[MusicSource]:
+    @classmethod
+    def _build_cat_param(cls, categories: list[int]) -> str:
+        """Build the comma-separated cat parameter, without duplicates.
+
+        The full default audio set collapses to the Audio parent category.
+        """
+        unique = list(dict.fromkeys(categories))
+        if set(unique) == set(cls.DEFAULT_AUDIO_CATEGORIES):
+            return str(cls.AUDIO_PARENT_CATEGORY)
+        return ",".join(map(str, unique))
+
+    def _get_cached_search(self, cache_key: tuple) -> Optional[List[MusicSource]]:
+        """Return a copy of cached search results, or None if missing/expired."""
+        cached = self._search_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        cached_at, cached_results = cached
+        if time.monotonic() - cached_at >= self.SEARCH_CACHE_TTL:
+            del self._search_cache[cache_key]
+            return None
+
+        self._search_cache.move_to_end(cache_key)
+        return list(cached_results)
+
+    def _store_search(self, cache_key: tuple, results: List[MusicSource]):
+        """Cache search results, evicting the least recently used entry."""
+        self._search_cache[cache_key] = (time.monotonic(), list(results))
+        if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps connections to Jackett alive between
+        searches instead of reconnecting for every query, and multiplexes
+        concurrent searches over one HTTP/2 connection when available.
+        """
+        async with self._client_lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.AsyncClient(
+                    http2=HTTP2_AVAILABLE,
+                    headers={"User-Agent": f"karma-player/{__version__}"},
+                    timeout=self.timeout,
+                    limits=httpx.Limits(
+                        max_connections=100,
+                        max_keepalive_connections=20,
+                        keepalive_expiry=60,
+                    ),
+                )
+            return self._client
+
+    async def close(self):
+        """Close the shared HTTP client."""
+        async with self._client_lock:
+            if self._client is not None and not self._client.is_closed:
+                await self._client.aclose()
+            self._client = None
+
+    def _parse_torznab_xml(self, xml_data: bytes | str) -> List[MusicSource]:
         """Parse Torznab XML response.
 
         Args:
-            xml_text: XML response from Jackett
+            xml_data: XML response from Jackett (raw bytes; str is encoded
+                as UTF-8)
 
         Returns:
             List of MusicSource objects
         """
-        results = []
+        return _build_sources(self._extract_items(xml_data))
+
+    def _extract_items(self, xml_data: bytes | str) -> List[dict]:
+        """Pull the raw fields of every <item> out of a Torznab response.
+
+        Args:
+            xml_data: XML response from Jackett (raw bytes; str is encoded
+                as UTF-8)
+
+        Returns:
+            List of plain dicts for _build_sources
+        """
+        rows = []
+        if isinstance(xml_data, str):
+            xml_data = xml_data.encode("utf-8")
 
         try:
-            root = ET.fromstring(xml_text)
+            # Stream items instead of building the whole document; each
+            # <item> is complete when its end event arrives.
+            context = etree.iterparse(
+                BytesIO(xml_data), events=("end",), tag="item"
+            )
 
             # Torznab uses RSS 2.0 format with custom namespace
-            for item in root.findall(".//item"):
-                try:
-                    # Extract basic fields
-                    title = item.findtext("title", "Unknown")
-                    link = item.findtext("link", "")
-
-                    # Extract torznab attributes
-                    attrs = {}
-                    for attr in item.findall(".//{http://torznab.com/schemas/2015/feed}attr"):
-                        name = attr.get("name")
-                        value = attr.get("value")
-                        if name and value:
-                            attrs[name] = value
-
-                    # Get magnet link (prefer magneturl over link)
-                    magnet_link = attrs.get("magneturl", "")
-                    if not magnet_link and link.startswith("magnet:"):
-                        magnet_link = link
-
-                    # ONLY accept real magnet URIs (skip Jackett proxy URLs)
-                    # Jackett proxy URLs (base_url/dl/) can't be used with libtorrent
-                    if not magnet_link or not magnet_link.startswith("magnet:"):
-                        continue  # Skip if no valid magnet link
-
-                    # Parse attributes
-                    seeders = int(attrs.get("seeders", "0"))
-                    leechers = int(attrs.get("peers", "0"))  # peers = leechers in Torznab
-
-                    # Size can be in <size> tag or torznab:attr
-                    size_bytes = int(item.findtext("size", "0"))
-                    if size_bytes == 0:
-                        size_bytes = int(attrs.get("size", "0"))
-
-                    # Parse upload date
-                    pub_date = item.findtext("pubDate", "")
-                    uploaded_at = self._parse_rfc822_date(pub_date)
-
-                    # Extract indexer name from <jackettindexer> tag
-                    indexer_tag = item.find("jackettindexer")
-                    if indexer_tag is not None and indexer_tag.text:
-                        indexer = indexer_tag.text
-                    else:
-                        indexer = attrs.get("indexer", "Jackett")
-
-                    # Extract metadata from title
-                    extractor = MetadataExtractor()
-                    format_type = extractor.extract_format(title)
-                    bitrate = extractor.extract_bitrate(title)
-                    source = extractor.extract_source(title)
-
-                    # If format not found in title, infer from Torznab category
-                    if not format_type:
-                        # Use <category> tag (Torznab standard), NOT torznab:attr category
-                        category = item.findtext("category", "")
-                        if category:
-                            try:
-                                category_int = int(category)
-                            except ValueError:
-                                category_int = 0
-                        else:
-                            category_int = 0
-
-                        if category_int:
-                            if category_int == 3040:  # Audio/Lossless
-                                format_type = "FLAC"
-                            elif category_int == 3010:  # Audio/MP3
-                                format_type = "MP3"
-                            elif category_int == 3030:  # Audio/Audiobook
-                                format_type = "AAC"  # Common audiobook format
-                            elif category_int in [3000, 3050]:  # Audio (general/other)
-                                # Check title for hints
-                                title_lower = title.lower()
-                                if "flac" in title_lower or "24bit" in title_lower or "24-bit" in title_lower:
-                                    format_type = "FLAC"
-                                elif "mp3" in title_lower or "320kbps" in title_lower or "320k" in title_lower or "cbr" in title_lower:
-                                    format_type = "MP3"
-                                elif "aac" in title_lower:
-                                    format_type = "AAC"
-
-                    # Generate infohash for ID
-                    import re
-                    import hashlib
-                    match = re.search(r"xt=urn:btih:([a-fA-F0-9]+)", magnet_link)
-                    if match:
-                        infohash = match.group(1).lower()
-                    else:
-                        infohash = hashlib.sha1(magnet_link.encode()).hexdigest()[:40].lower()
-
-                    results.append(
-                        MusicSource(
-                            id=infohash,
-                            title=title,
-                            format=format_type,
-                            source_type=SourceType.TORRENT,
-                            url=magnet_link,
-                            indexer=indexer,
-                            seeders=seeders,
-                            leechers=leechers,
-                            size_bytes=size_bytes,
-                            uploaded_at=uploaded_at,
-                            bitrate=bitrate,
-                            magnet_link=magnet_link,  # Backward compatibility
-                        )
-                    )
-
-                except (ValueError, AttributeError):
-                    continue  # Skip malformed items
-
-        except ET.ParseError:
+            for _, item in context:
+                # Strip the torznab namespace so lookups use plain tags
+                for elem in item.iter(_TORZNAB_ANY_TAG):
+                    elem.tag = etree.QName(elem).localname
+
+                # Extract torznab attributes
+                attrs = {}
+                for attr in item.iter("attr"):
+                    name = attr.get("name")
+                    value = attr.get("value")
+                    if name and value:
+                        attrs[name] = value
+
+                rows.append({
+                    "title": item.findtext("title", "Unknown"),
+                    "link": item.findtext("link", ""),
+                    "attrs": attrs,
+                    "size": item.findtext("size", "0"),
+                    "pub_date": item.findtext("pubDate", ""),
+                    "indexer": item.findtext("jackettindexer"),
+                    "category": item.findtext("category", ""),
+                })
+
+                # Drop the processed item and everything before it so
+                # memory stays bounded by a single item.
+                item.clear()
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
+
+        except etree.XMLSyntaxError:
             pass  # Invalid XML
 
-        return results
+        return rows
 
-    def _parse_rfc822_date(self, date_str: str) -> datetime:
-        """Parse RFC 822 date format used in RSS.
-
-        Args:
-            date_str: Date string (e.g., 'Mon, 01 Jan 2024 12:00:00 +0000')
 
-        Returns:
-            datetime object (UTC)
-        """
+def _build_sources(rows: List[dict]) -> List[MusicSource]:
+    """Turn raw Torznab item fields into MusicSource objects."""
+    results = []
+    # Fallback upload time for items without a usable pubDate
+    now = datetime.now(timezone.utc)
+    for row in rows:
         try:
-            from email.utils import parsedate_to_datetime
-            return parsedate_to_datetime(date_str)
-        except:
-            return datetime.now(timezone.utc)
+            source = _build_source(row, now)
+        except (ValueError, AttributeError):
+            continue  # Skip malformed items
+        if source is not None:
+            results.append(source)
+    return results
+
+
+def _build_source(row: dict, now: datetime) -> Optional[MusicSource]:
+    """Build one MusicSource, or None if the item is unusable.
+
+    The pubDate is parsed last, once every check that can drop the item
+    has passed.
+    """
+    title = row["title"]
+    attrs = row["attrs"]
+
+    # Get magnet link (prefer magneturl over link)
+    magnet_link = attrs.get("magneturl", "")
+    if not magnet_link and row["link"].startswith("magnet:"):
+        magnet_link = row["link"]
+
+    # ONLY accept real magnet URIs (skip Jackett proxy URLs)
+    # Jackett proxy URLs (base_url/dl/) can't be used with libtorrent
+    if not magnet_link or not magnet_link.startswith("magnet:"):
+        return None  # Skip if no valid magnet link
+
+    # Parse attributes
+    seeders = int(attrs.get("seeders", "0"))
+    leechers = int(attrs.get("peers", "0"))  # peers = leechers in Torznab
+
+    # Size can be in <size> tag or torznab:attr
+    size_bytes = int(row["size"])
+    if size_bytes == 0:
+        size_bytes = int(attrs.get("size", "0"))
+
+    # Indexer name from <jackettindexer> tag
+    indexer = row["indexer"] or attrs.get("indexer", "Jackett")
+
+    # Extract metadata from title
+    format_type, bitrate, source = extract_all(title)
+
+    # If format not found in title, infer from Torznab category
+    if not format_type:
+        # Use <category> tag (Torznab standard), NOT torznab:attr category
+        category = row["category"]
+        if category:
+            try:
+                category_int = int(category)
+            except ValueError:
+                category_int = 0
+        else:
+            category_int = 0
+
+        format_type = _CATEGORY_FORMAT.get(category_int)
+        if format_type is None and category_int in _CATEGORY_GENERIC:
+            # Check title for hints
+            format_type = _format_from_title_hints(title)
+
+    # Generate infohash for ID
+    # (SHA1 of the magnet only for the rare magnet without a btih;
+    # hexdigest is already lowercase)
+    match = _INFOHASH_RE.search(magnet_link)
+    infohash = (
+        match.group(1).lower() if match else hashlib.sha1(magnet_link.encode()).hexdigest()
+    )
+
+    # Parse upload date
+    uploaded_at = _parse_rfc822_date(row["pub_date"], now)
+
+    return MusicSource(
+        id=infohash,
+        title=title,
+        format=format_type,
+        source_type=SourceType.TORRENT,
+        url=magnet_link,
+        indexer=indexer,
+        seeders=seeders,
+        leechers=leechers,
+        size_bytes=size_bytes,
+        uploaded_at=uploaded_at,
+        bitrate=bitrate,
+        magnet_link=magnet_link,  # Backward compatibility
+    )
+
+
+def _parse_rfc822_date(date_str: str, default: datetime) -> datetime:
+    """Parse RFC 822 date format used in RSS.
+
+    Args:
+        date_str: Date string (e.g., 'Mon, 01 Jan 2024 12:00:00 +0000')
+        default: Returned when date_str is missing or unparseable
+
+    Returns:
+        datetime object (UTC)
+    """
+    if not date_str:
+        return default
+    try:
+        return parsedate_to_datetime(date_str)
+    except Exception:
+        return default
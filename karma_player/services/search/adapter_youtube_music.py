@@ -4,7 +4,13 @@ YouTube Music streaming adapter using ytmusicapi + yt-dlp for URL resolution
 import asyncio
 import logging
 import random
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import List, Optional, Dict, Any
+from urllib.parse import parse_qs, urlparse
 from ytmusicapi import YTMusic
 import yt_dlp
 
@@ -27,6 +33,128 @@ USER_AGENTS = [
     "Mozilla/5.0 (Linux; Android 13; SM-S908B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.0.0 Mobile Safari/537.36"
 ]
 
+# ytmusicapi and yt-dlp are blocking; give them their own bounded pool so a
+# burst of searches/resolutions can't starve the loop's default executor.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ytm")
+
+# "MM:SS" or "H:MM:SS"
+_DURATION_RE = re.compile(r"^(?:(\d+):)?(\d+):(\d+)$")
+
+# Resolved stream URLs by video ID: (expires_at, url), least recently used
+# first. Wall-clock time, because YouTube signs an absolute "expire"
+# timestamp into the URL.
+STREAM_URL_TTL = 3600  # seconds
+STREAM_URL_EXPIRY_MARGIN = 60  # stop handing out URLs this close to expiry
+STREAM_URL_CACHE_SIZE = 512
+_STREAM_URL_CACHE: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+
+def _stream_url_expires_at(url: str, now: float) -> float:
+    """Return when a resolved stream URL should be dropped from the cache.
+
+    Uses the URL's own ``expire`` parameter when present, capped at
+    STREAM_URL_TTL.
+    """
+    expires_at = now + STREAM_URL_TTL
+    expire = parse_qs(urlparse(url).query).get("expire")
+    if expire:
+        try:
+            expires_at = min(expires_at, float(expire[0]) - STREAM_URL_EXPIRY_MARGIN)
+        except ValueError:
+            pass
+    return expires_at
+
+
+def _cached_stream_url(video_id: str) -> Optional[str]:
+    """Return a still-valid cached stream URL for video_id, if any."""
+    cached = _STREAM_URL_CACHE.get(video_id)
+    if cached is None:
+        return None
+
+    expires_at, url = cached
+    if time.time() < expires_at:
+        _STREAM_URL_CACHE.move_to_end(video_id)
+        return url
+    del _STREAM_URL_CACHE[video_id]
+    return None
+
+
+def _store_stream_url(video_id: str, url: str):
+    """Cache a resolved stream URL, dropping expired and least recently used entries.
+
+    Only called from the event loop, like _cached_stream_url.
+    """
+    now = time.time()
+    expired = [key for key, (expires_at, _) in _STREAM_URL_CACHE.items() if expires_at <= now]
+    for key in expired:
+        del _STREAM_URL_CACHE[key]
+
+    _STREAM_URL_CACHE[video_id] = (_stream_url_expires_at(url, now), url)
+    _STREAM_URL_CACHE.move_to_end(video_id)
+    while len(_STREAM_URL_CACHE) > STREAM_URL_CACHE_SIZE:
+        _STREAM_URL_CACHE.popitem(last=False)
+
+
+def _ydl_options() -> Dict[str, Any]:
+    """Spotube-inspired yt-dlp options with a randomly picked user agent."""
+    # Pick a random user agent to avoid bot detection
+    user_agent = random.choice(USER_AGENTS)
+    logger.debug(f"Using user-agent: {user_agent[:50]}...")
+
+    return {
+        'format': 'bestaudio/best',
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': False,
+        'skip_download': True,
+        # Spotube flags to avoid bot detection
+        'geo_bypass': True,  # Bypass geographic restrictions
+        'nocheckcertificate': True,  # Skip SSL certificate verification
+        'http_headers': {
+            'User-Agent': user_agent,  # Random user agent rotation
+        }
+    }
+
+
+def _best_audio_url(info: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Pick the highest-bitrate audio-only format URL from yt-dlp info."""
+    # Get the best audio format
+    if info and 'formats' in info:
+        # Filter for audio-only formats
+        audio_formats = [f for f in info['formats'] if f.get('acodec') != 'none' and f.get('vcodec') == 'none']
+
+        if audio_formats:
+            # Sort by audio bitrate, get highest
+            best_audio = max(audio_formats, key=lambda f: f.get('abr', 0))
+            return best_audio.get('url')
+
+    # Fallback: use the first available URL
+    return info.get('url') if info else None
+
+
+def _extract_audio_url(video_id: str) -> Optional[str]:
+    """Resolve one video ID to an audio stream URL with yt-dlp (blocking).
+
+    Runs in the adapter's thread pool, so it leaves the URL cache to the
+    caller on the event loop. Failures map to None.
+    """
+    try:
+        with yt_dlp.YoutubeDL(_ydl_options()) as ydl:
+            info = ydl.extract_info(
+                f"https://music.youtube.com/watch?v={video_id}",
+                download=False
+            )
+        url = _best_audio_url(info)
+    except Exception as e:
+        logger.error(f"❌ Failed to resolve stream URL for {video_id}: {e}")
+        return None
+
+    if url:
+        logger.debug(f"✅ Resolved stream URL for {video_id}")
+    else:
+        logger.warning(f"⚠️  No stream URL found for {video_id}")
+    return url
+
 
 class AdapterYouTubeMusic(SourceAdapter):
     """YouTube Music streaming source adapter"""
@@ -34,6 +162,8 @@ class AdapterYouTubeMusic(SourceAdapter):
     def __init__(self):
         super().__init__()
         self.client = YTMusic()
+        # Resolutions in progress, so concurrent requests share one yt-dlp run
+        self._inflight: Dict[str, asyncio.Future] = {}
         logger.info("✅ YouTube Music adapter initialized")
 
     @property
@@ -58,59 +188,30 @@ class AdapterYouTubeMusic(SourceAdapter):
         Returns:
             Direct audio stream URL or None if resolution fails
         """
-        try:
-            # Pick a random user agent to avoid bot detection
-            user_agent = random.choice(USER_AGENTS)
-            logger.debug(f"Using user-agent: {user_agent[:50]}...")
-
-            # Spotube-inspired yt-dlp configuration
-            ydl_opts = {
-                'format': 'bestaudio/best',
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': False,
-                'skip_download': True,
-                # Spotube flags to avoid bot detection
-                'geo_bypass': True,  # Bypass geographic restrictions
-                'nocheckcertificate': True,  # Skip SSL certificate verification
-                'http_headers': {
-                    'User-Agent': user_agent,  # Random user agent rotation
-                }
-            }
-
-            # Run yt-dlp in thread pool since it's synchronous
-            def extract_url():
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(
-                        f"https://music.youtube.com/watch?v={video_id}",
-                        download=False
-                    )
-
-                    # Get the best audio format
-                    if info and 'formats' in info:
-                        # Filter for audio-only formats
-                        audio_formats = [f for f in info['formats'] if f.get('acodec') != 'none' and f.get('vcodec') == 'none']
-
-                        if audio_formats:
-                            # Sort by audio bitrate, get highest
-                            best_audio = max(audio_formats, key=lambda f: f.get('abr', 0))
-                            return best_audio.get('url')
-
-                    # Fallback: use the first available URL
-                    return info.get('url') if info else None
-
-            url = await asyncio.to_thread(extract_url)
-
-            if url:
-                logger.debug(f"✅ Resolved stream URL for {video_id}")
-                return url
-            else:
-                logger.warning(f"⚠️  No stream URL found for {video_id}")
-                return None
-
-        except Exception as e:
-            logger.error(f"❌ Failed to resolve stream URL for {video_id}: {e}")
-            return None
+        url = _cached_stream_url(video_id)
+        if url is not None:
+            return url
+
+        future = self._inflight.get(video_id)
+        if future is None:
+            future = asyncio.ensure_future(self._extract_stream_url(video_id))
+            self._track_inflight(video_id, future)
+
+        # Shielded so one caller giving up doesn't cancel it for the others
+        return await asyncio.shield(future)
+
+    def _track_inflight(self, video_id: str, future: asyncio.Future):
+        """Share future with concurrent callers until it completes."""
+        self._inflight[video_id] = future
+        future.add_done_callback(lambda _: self._inflight.pop(video_id, None))
+
+    async def _extract_stream_url(self, video_id: str) -> Optional[str]:
+        """Run yt-dlp for one video ID and cache the resulting URL."""
+        loop = asyncio.get_running_loop()
+        url = await loop.run_in_executor(_EXECUTOR, _extract_audio_url, video_id)
+        if url:
+            _store_stream_url(video_id, url)
+        return url
 
     async def search(self, query: str) -> List[MusicSource]:
         """
@@ -129,8 +230,9 @@ class AdapterYouTubeMusic(SourceAdapter):
             # Filter types: songs, videos, albums, artists, playlists
             # We'll focus on songs for music streaming
             # ytmusicapi is synchronous, so run in thread pool
-            results = await asyncio.to_thread(
-                self.client.search, query, filter="songs", limit=20
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(
+                _EXECUTOR, partial(self.client.search, query, filter="songs", limit=20)
             )
 
             sources = []
@@ -155,16 +257,10 @@ class AdapterYouTubeMusic(SourceAdapter):
                     # Duration
                     duration_seconds = None
                     duration_str = item.get("duration")
-                    if duration_str:
-                        # Parse "MM:SS" or "H:MM:SS"
-                        parts = duration_str.split(":")
-                        try:
-                            if len(parts) == 2:  # MM:SS
-                                duration_seconds = int(parts[0]) * 60 + int(parts[1])
-                            elif len(parts) == 3:  # H:MM:SS
-                                duration_seconds = int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-                        except ValueError:
-                            pass
+                    match = _DURATION_RE.match(duration_str) if duration_str else None
+                    if match:
+                        hours, minutes, seconds = match.groups()
+                        duration_seconds = int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
 
                     # Thumbnail
                     thumbnails = item.get("thumbnails", [])
@@ -190,9 +286,6 @@ class AdapterYouTubeMusic(SourceAdapter):
                         format="OPUS",
                     )
 
-                    # Calculate quality score
-                    source.quality_score = source.calculate_quality_score()
-
                     sources.append(source)
 
                     logger.debug(f"   ✅ Added: {full_title[:50]}...")
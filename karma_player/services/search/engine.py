@@ -1,8 +1,10 @@
 """Search engine orchestrator for music sources."""
 
 import asyncio
+import heapq
 import logging
-from typing import List, Optional
+from operator import attrgetter
+from typing import AsyncIterator, List, Optional, Set
 
 from karma_player.models.source import MusicSource
 from karma_player.services.search.source_adapter import SourceAdapter
@@ -13,19 +15,27 @@ logger = logging.getLogger(__name__)
 class SearchEngine:
     """Orchestrates searches across multiple music source adapters."""
 
-    def __init__(self, adapters: List[SourceAdapter]):
+    def __init__(self, adapters: List[SourceAdapter], adapter_timeout: Optional[float] = None):
         """Initialize search engine with adapters.
 
         Args:
             adapters: List of SourceAdapter instances
+            adapter_timeout: Seconds each adapter search may take before it
+                counts as failed (None leaves it to the adapter's own timeout)
         """
         self.adapters = adapters
+        self.adapter_timeout = adapter_timeout
+
+    async def close(self):
+        """Close every adapter's network resources."""
+        await asyncio.gather(*(adapter.close() for adapter in self.adapters))
 
     async def search(
         self,
         query: str,
         format_filter: Optional[str] = None,
         min_seeders: int = 5,
+        limit: Optional[int] = None,
     ) -> List[MusicSource]:
         """Search all healthy sources and return deduplicated, sorted results.
 
@@ -33,6 +43,7 @@ class SearchEngine:
             query: Search query string
             format_filter: Optional format filter (FLAC, MP3, etc.)
             min_seeders: Minimum number of seeders (applies to torrent sources only)
+            limit: Return only the best N results (avoids sorting everything)
 
         Returns:
             List of MusicSource objects, deduplicated and sorted by quality
@@ -44,51 +55,136 @@ class SearchEngine:
         if not healthy_adapters:
             return []
 
-        # Search all adapters concurrently
-        tasks = [adapter.search(query) for adapter in healthy_adapters]
-        results_lists = await asyncio.gather(*tasks, return_exceptions=True)
+        # Search all adapters concurrently, total latency is the slowest one
+        outcomes = await asyncio.gather(
+            *(self._search_adapter(adapter, query) for adapter in healthy_adapters)
+        )
 
         # Combine results from all adapters
         all_results = []
-        for adapter, results in zip(healthy_adapters, results_lists):
-            if isinstance(results, Exception):
-                # Adapter failed, mark unhealthy and continue
-                logger.error(f"   ❌ {adapter.name} failed: {results}", exc_info=results)
-                adapter._update_health(success=False)
-                continue
+        for adapter, results in outcomes:
+            all_results.extend(self._accept_results(adapter, results))
+
+        filtered_results = self._filter_results(
+            all_results, format_filter, min_seeders, seen_hashes=set()
+        )
+
+        # Sort by quality score (highest first)
+        if limit is not None:
+            return heapq.nlargest(limit, filtered_results, key=attrgetter("quality_score"))
+        filtered_results.sort(key=attrgetter("quality_score"), reverse=True)
+
+        return filtered_results
+
+    async def search_stream(
+        self,
+        query: str,
+        format_filter: Optional[str] = None,
+        min_seeders: int = 5,
+        soft_deadline: Optional[float] = None,
+    ) -> AsyncIterator[List[MusicSource]]:
+        """Search all healthy sources, yielding results as each one finishes.
 
-            logger.info(f"   ✓ {adapter.name}: {len(results)} results")
-            adapter._update_health(success=True)
-            all_results.extend(results)
+        Fast adapters (e.g. YouTube Music) show up immediately instead of
+        waiting for slow ones (e.g. Jackett fanning out to many indexers).
+        Each batch is filtered, deduplicated against earlier batches and
+        sorted by quality.
 
-        # Deduplicate by infohash
+        Args:
+            query: Search query string
+            format_filter: Optional format filter (FLAC, MP3, etc.)
+            min_seeders: Minimum number of seeders (applies to torrent sources only)
+            soft_deadline: Seconds to wait before cancelling adapters that
+                haven't answered yet (None waits for all)
+
+        Yields:
+            Non-empty lists of new MusicSource objects, best first
+        """
+        healthy_adapters = [a for a in self.adapters if a.is_healthy]
+        logger.info(f"🔍 Streaming search with {len(healthy_adapters)} healthy adapters: {[a.name for a in healthy_adapters]}")
+
+        tasks = [
+            asyncio.create_task(self._search_adapter(adapter, query))
+            for adapter in healthy_adapters
+        ]
         seen_hashes = set()
-        unique_results = []
-        for result in all_results:
+
+        try:
+            for next_done in asyncio.as_completed(tasks, timeout=soft_deadline):
+                try:
+                    adapter, results = await next_done
+                except asyncio.TimeoutError:
+                    pending = sum(not task.done() for task in tasks)
+                    logger.warning(f"   ⏱️ Soft deadline reached, dropping {pending} slow adapter(s)")
+                    break
+
+                batch = self._filter_results(
+                    self._accept_results(adapter, results),
+                    format_filter,
+                    min_seeders,
+                    seen_hashes,
+                )
+                if batch:
+                    batch.sort(key=attrgetter("quality_score"), reverse=True)
+                    yield batch
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _search_adapter(self, adapter: SourceAdapter, query: str) -> tuple:
+        """Run one adapter search, returning (adapter, results or exception).
+
+        Searches running past adapter_timeout return a TimeoutError, which
+        counts against the adapter's health like any other failure.
+        """
+        try:
+            return adapter, await asyncio.wait_for(adapter.search(query), self.adapter_timeout)
+        except asyncio.TimeoutError:
+            return adapter, TimeoutError(f"no results within {self.adapter_timeout}s")
+        except Exception as e:
+            return adapter, e
+
+    @staticmethod
+    def _accept_results(adapter: SourceAdapter, results) -> List[MusicSource]:
+        """Record adapter health for one search outcome and return its results."""
+        if isinstance(results, Exception):
+            # Adapter failed, mark unhealthy and continue
+            logger.error(f"   ❌ {adapter.name} failed: {results}", exc_info=results)
+            adapter._update_health(success=False)
+            return []
+
+        logger.info(f"   ✓ {adapter.name}: {len(results)} results")
+        adapter._update_health(success=True)
+        return results
+
+    @staticmethod
+    def _filter_results(
+        results: List[MusicSource],
+        format_filter: Optional[str],
+        min_seeders: int,
+        seen_hashes: Set[str],
+    ) -> List[MusicSource]:
+        """Filter and deduplicate by infohash in one pass.
+
+        Non-torrent sources (streaming) have no seeders and always pass the
+        seeder check. MusicSource.format is already uppercase. seen_hashes is
+        updated in place.
+        """
+        fmt = format_filter.upper() if format_filter else None
+        filtered_results = []
+        for result in results:
+            if fmt and result.format != fmt:
+                continue
+            if result.seeders is not None and result.seeders < min_seeders:
+                continue
+
             infohash = result.infohash
-            if not infohash:
-                # No infohash (invalid magnet), include anyway
-                unique_results.append(result)
-            elif infohash not in seen_hashes:
+            if infohash:
+                if infohash in seen_hashes:
+                    continue
                 seen_hashes.add(infohash)
-                unique_results.append(result)
-            # else: duplicate, skip
-
-        # Filter by minimum seeders (only applies to torrent sources)
-        # Non-torrent sources (streaming) are always included since they don't have seeders
-        filtered_results = [
-            r for r in unique_results
-            if r.seeders is None or r.seeders >= min_seeders
-        ]
+            # No infohash (invalid magnet): include anyway
 
-        # Filter by format if specified
-        if format_filter:
-            filtered_results = [
-                r for r in filtered_results
-                if r.format and r.format.upper() == format_filter.upper()
-            ]
-
-        # Sort by quality score (highest first)
-        filtered_results.sort(key=lambda r: r.quality_score, reverse=True)
+            filtered_results.append(result)
 
         return filtered_results
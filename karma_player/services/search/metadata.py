@@ -1,115 +1,184 @@
 """Metadata extraction from torrent titles."""
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+# Regex patterns (case-insensitive)
+FORMAT_PATTERN = re.compile(
+    r"\b(FLAC|MP3|AAC|ALAC|OGG|Opus)\b", re.IGNORECASE
+)
+BITRATE_PATTERN = re.compile(
+    r"\b(320|256|192|V0|V2)(?:kbps)?\b", re.IGNORECASE
+)
+SOURCE_PATTERN = re.compile(
+    r"\b(WEB|CD|Vinyl|DVD|BD)\b", re.IGNORECASE
+)
+# All three of the above as one alternation, for extract_all
+COMBINED_PATTERN = re.compile(
+    r"\b(?P<fmt>FLAC|MP3|AAC|ALAC|OGG|Opus)\b"
+    r"|\b(?P<br>320|256|192|V0|V2)(?:kbps)?\b"
+    r"|\b(?P<src>WEB|CD|Vinyl|DVD|BD)\b",
+    re.IGNORECASE,
+)
+# Bytes per size unit (binary multiples, as indexers report them)
+KB = 1 << 10
+MB = 1 << 20
+GB = 1 << 30
+# Size units accepted by parse_size
+SIZE_UNITS = {"GB": GB, "MB": MB, "KB": KB}
+# Canonical spelling of each release source, keyed by lowercase match
+SOURCE_NAMES = {"web": "WEB", "cd": "CD", "vinyl": "Vinyl", "dvd": "DVD", "bd": "BD"}
+# Seeder thresholds and the ranking tags they earn, highest first
+SEEDER_TAGS = (
+    (50, ("fast", "popular")),
+    (10, ("fast",)),
+)
+# Bitrate markers of hi-res lossless releases (24-bit, DSD)
+HIRES_PATTERN = re.compile(r"24|DSD", re.IGNORECASE)
+
+
+def extract_format(title: str) -> Optional[str]:
+    """Extract audio format from title.
+
+    Args:
+        title: Release title
+
+    Returns:
+        Format string (FLAC, MP3, etc.) or None
+    """
+    return _extract_all_cached(title)[0] if title else None
+
+
+def extract_bitrate(title: str) -> Optional[str]:
+    """Extract bitrate from title.
+
+    Args:
+        title: Release title
+
+    Returns:
+        Bitrate string (320, V0, etc.) or None
+    """
+    return _extract_all_cached(title)[1] if title else None
+
+
+def extract_source(title: str) -> Optional[str]:
+    """Extract source from title.
+
+    Args:
+        title: Release title
+
+    Returns:
+        Source string (WEB, CD, Vinyl, etc.) or None
+    """
+    return _extract_all_cached(title)[2] if title else None
+
+
+def extract_all(title: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Extract format, bitrate and source from title in one call.
+
+    Args:
+        title: Release title
+
+    Returns:
+        Tuple of (format, bitrate, source), each possibly None
+    """
+    return _extract_all_cached(title or "")
+
+
+def parse_size(size_str: str) -> int:
+    """Parse size string to bytes.
+
+    Args:
+        size_str: Size string like "1.5 GB" or "750 MB"
+
+    Returns:
+        Size in bytes, or 0 if invalid
+    """
+    size_str = size_str.rstrip() if size_str else ""
+
+    # Split off the trailing unit letters ("1.5 GB", "750MB")
+    i = len(size_str)
+    while i and size_str[i - 1].isalpha():
+        i -= 1
+
+    multiplier = SIZE_UNITS.get(size_str[i:].upper())
+    words = size_str[:i].split()
+    if multiplier is None or not words:
+        return 0
+
+    # Only plain digits and separators (float() would also take "nan")
+    number = words[-1]
+    if number.strip("0123456789,."):
+        return 0
+
+    try:
+        # Handle comma as decimal separator (European format)
+        value = float(number.replace(",", "."))
+    except ValueError:
+        return 0
+
+    return int(value * multiplier)
+
+
+def seeder_tags(seeders: int) -> Tuple[str, ...]:
+    """Return the ranking tags earned by a seeder count.
+
+    Args:
+        seeders: Number of seeders
 
+    Returns:
+        Tuple of tags (possibly empty)
+    """
+    for threshold, tags in SEEDER_TAGS:
+        if seeders >= threshold:
+            return tags
+    return ()
 
-class MetadataExtractor:
-    """Extract music metadata from release titles."""
 
-    # Regex patterns (case-insensitive)
-    FORMAT_PATTERN = re.compile(
-        r"\b(FLAC|MP3|AAC|ALAC|OGG|Opus)\b", re.IGNORECASE
-    )
-    BITRATE_PATTERN = re.compile(
-        r"\b(320|256|192|V0|V2)(?:kbps)?\b", re.IGNORECASE
-    )
-    SOURCE_PATTERN = re.compile(
-        r"\b(WEB|CD|Vinyl|DVD|BD)\b", re.IGNORECASE
-    )
-    SIZE_PATTERN = re.compile(
-        r"([\d,\.]+)\s*(GB|MB|KB)", re.IGNORECASE
+@lru_cache(maxsize=4096)
+def _extract_all_cached(title: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Scan title once for (format, bitrate, source), memoized per title.
+
+    The same release name is often returned by several indexers, and
+    every extract_* call goes through here. Only the first match of each
+    kind counts.
+    """
+    found = {}
+    for match in COMBINED_PATTERN.finditer(title):
+        kind = match.lastgroup
+        if kind not in found:
+            found[kind] = match.group(kind)
+            if len(found) == 3:
+                break
+
+    fmt = found.get("fmt")
+    bitrate = found.get("br")
+    source = found.get("src")
+    return (
+        fmt.upper() if fmt else None,
+        bitrate.upper() if bitrate else None,
+        SOURCE_NAMES[source.lower()] if source else None,
     )
 
-    @staticmethod
-    def extract_format(title: str) -> Optional[str]:
-        """Extract audio format from title.
-
-        Args:
-            title: Release title
-
-        Returns:
-            Format string (FLAC, MP3, etc.) or None
-        """
-        if not title:
-            return None
-
-        match = MetadataExtractor.FORMAT_PATTERN.search(title)
-        if match:
-            return match.group(1).upper()
-        return None
-
-    @staticmethod
-    def extract_bitrate(title: str) -> Optional[str]:
-        """Extract bitrate from title.
-
-        Args:
-            title: Release title
-
-        Returns:
-            Bitrate string (320, V0, etc.) or None
-        """
-        if not title:
-            return None
-
-        match = MetadataExtractor.BITRATE_PATTERN.search(title)
-        if match:
-            return match.group(1).upper()
-        return None
-
-    @staticmethod
-    def extract_source(title: str) -> Optional[str]:
-        """Extract source from title.
-
-        Args:
-            title: Release title
-
-        Returns:
-            Source string (WEB, CD, Vinyl, etc.) or None
-        """
-        if not title:
-            return None
-
-        match = MetadataExtractor.SOURCE_PATTERN.search(title)
-        if match:
-            # Capitalize properly
-            source = match.group(1)
-            if source.lower() == "vinyl":
-                return "Vinyl"
-            return source.upper()
-        return None
-
-    @staticmethod
-    def parse_size(size_str: str) -> int:
-        """Parse size string to bytes.
-
-        Args:
-            size_str: Size string like "1.5 GB" or "750 MB"
-
-        Returns:
-            Size in bytes, or 0 if invalid
-        """
-        if not size_str:
-            return 0
-
-        match = MetadataExtractor.SIZE_PATTERN.search(size_str)
-        if not match:
-            return 0
-
-        try:
-            # Handle comma as decimal separator (European format)
-            value_str = match.group(1).replace(",", ".")
-            value = float(value_str)
-            unit = match.group(2).upper()
-
-            if unit == "GB":
-                return int(value * (1024**3))
-            elif unit == "MB":
-                return int(value * (1024**2))
-            elif unit == "KB":
-                return int(value * 1024)
-            else:
-                return 0
-
-        except (ValueError, AttributeError):
-            return 0
+
+class MetadataExtractor:
+    """Extract music metadata from release titles.
+
+    Kept for backwards compatibility; delegates to the module-level
+    functions above.
+    """
+
+    FORMAT_PATTERN = FORMAT_PATTERN
+    BITRATE_PATTERN = BITRATE_PATTERN
+    SOURCE_PATTERN = SOURCE_PATTERN
+    COMBINED_PATTERN = COMBINED_PATTERN
+    SIZE_UNITS = SIZE_UNITS
+    SOURCE_NAMES = SOURCE_NAMES
+
+    extract_format = staticmethod(extract_format)
+    extract_bitrate = staticmethod(extract_bitrate)
+    extract_source = staticmethod(extract_source)
+    extract_all = staticmethod(extract_all)
+    parse_size = staticmethod(parse_size)
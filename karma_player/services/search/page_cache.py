@@ -0,0 +1,89 @@
+"""On-disk TTL cache for scraped indexer pages."""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+class PageCache:
+    """Small sqlite-backed key/value store with per-entry expiry.
+
+    Values are stored as JSON. Cache failures never propagate: a broken or
+    locked database, or an undecodable entry, behaves like a cache miss.
+    Expired entries are deleted when the database is opened and on every
+    write, so the file doesn't grow without bound.
+
+    Calls block on disk I/O; async code should run them in a thread.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize cache.
+
+        Args:
+            path: SQLite database file (created on first use)
+        """
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the table on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS pages_expires_at ON pages (expires_at)"
+            )
+            with self._conn:
+                self._purge_expired(self._conn)
+        return self._conn
+
+    @staticmethod
+    def _purge_expired(conn: sqlite3.Connection):
+        """Delete every entry whose TTL has passed."""
+        conn.execute("DELETE FROM pages WHERE expires_at < ?", (time.time(),))
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for key, or None if missing or expired."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT value, expires_at FROM pages WHERE key = ?", (key,)
+                ).fetchone()
+        except (sqlite3.Error, OSError):
+            return None
+
+        if row is None or row[1] < time.time():
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return None  # Corrupt entry, treat as a miss
+
+    def set(self, key: str, value: Any, ttl: float):
+        """Store value under key for ttl seconds."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    self._purge_expired(conn)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO pages (key, value, expires_at) VALUES (?, ?, ?)",
+                        (key, json.dumps(value), time.time() + ttl),
+                    )
+        except (sqlite3.Error, OSError):
+            pass
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
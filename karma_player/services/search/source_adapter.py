@@ -1,5 +1,6 @@
 """Base adapter interface for music sources (torrents, streams, etc.)."""
 
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from typing import List
@@ -25,7 +26,7 @@ class SourceAdapter(ABC):
     def __init__(self):
         """Initialize adapter with health tracking."""
         self._consecutive_failures = 0
-        self._last_success = datetime.now(timezone.utc).timestamp()
+        self._last_success = time.time()
         self._last_failure = 0.0
         self._circuit_breaker_threshold = 3
         self._cooldown_seconds = 300  # 5 minutes
@@ -57,7 +58,7 @@ class SourceAdapter(ABC):
         # Circuit breaker open
         if self._consecutive_failures >= self._circuit_breaker_threshold:
             # Check if cooldown expired
-            time_since_failure = datetime.now(timezone.utc).timestamp() - self._last_failure
+            time_since_failure = time.time() - self._last_failure
             if time_since_failure < self._cooldown_seconds:
                 return False
             # Cooldown expired, reset and allow retry
@@ -82,6 +83,9 @@ class SourceAdapter(ABC):
         """
         pass
 
+    async def close(self):
+        """Release network resources (sessions, caches). No-op by default."""
+
     def _update_health(self, success: bool):
         """
         Update health status based on request outcome.
@@ -91,10 +95,10 @@ class SourceAdapter(ABC):
         """
         if success:
             self._consecutive_failures = 0
-            self._last_success = datetime.now(timezone.utc).timestamp()
+            self._last_success = time.time()
         else:
             self._consecutive_failures += 1
-            self._last_failure = datetime.now(timezone.utc).timestamp()
+            self._last_failure = time.time()
 
     @property
     def health_status(self) -> dict:
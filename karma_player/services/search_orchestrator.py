@@ -2,7 +2,9 @@
 Search orchestrator - Combines AI, MusicBrainz, and torrent search
 """
 import os
-from typing import List, Optional, Dict, Any
+import re
+import time
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
 from karma_player.models.search import ParsedQuery
@@ -10,6 +12,7 @@ from karma_player.models.source import MusicSource, RankedSource
 from karma_player.models.query import QueryIntent, MusicQuery
 from karma_player.services.musicbrainz_service import MusicBrainzService
 from karma_player.services.search.engine import SearchEngine
+from karma_player.services.search.metadata import GB, HIRES_PATTERN, MB, seeder_tags
 from karma_player.services.ai.local_ai import LocalAIClient
 
 
@@ -41,6 +44,9 @@ class SearchOrchestrator:
     4. Rank and explain results (AI + scoring)
     """
 
+    # Explicit "artist - album" separators: " - ", " / " or " | "
+    _SEPARATOR_RE = re.compile(r" [-/|] ")
+
     def __init__(
         self,
         search_engine: SearchEngine,
@@ -60,9 +66,13 @@ class SearchOrchestrator:
                 # Fallback to OpenAI
                 elif os.getenv("OPENAI_API_KEY"):
                     self.ai_client = LocalAIClient(provider="openai")
-            except:
+            except Exception:
                 pass  # No AI available, will use fallback
 
+    async def close(self):
+        """Close the MusicBrainz HTTP session."""
+        await self.musicbrainz.close()
+
     async def search(
         self,
         query: str,
@@ -78,8 +88,7 @@ class SearchOrchestrator:
         Returns:
             SearchResult with ranked music sources
         """
-        import time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         def report_progress(stage: str, message: str, percent: int):
             if progress_callback:
@@ -92,7 +101,7 @@ class SearchOrchestrator:
         if self.ai_client:
             try:
                 parsed_query = await self.ai_client.parse_query(query)
-            except:
+            except Exception:
                 pass  # Fall back to simple parsing
 
         # Fallback: Extract key terms
@@ -136,9 +145,10 @@ class SearchOrchestrator:
 
         # Create ranked results with simple explanations
         ranked_results = []
-        for i, source in enumerate(source_results[:50], 1):  # Limit to top 50
-            explanation = self._generate_explanation(source, i)
-            tags = self._generate_tags(source, i)
+        # Limit to top 50 (only copy when there are more)
+        top_results = source_results if len(source_results) <= 50 else source_results[:50]
+        for i, source in enumerate(top_results, 1):
+            explanation, tags = self._rank_one(source, i)
 
             ranked_results.append(
                 RankedSource(
@@ -152,7 +162,7 @@ class SearchOrchestrator:
         # Complete
         report_progress("complete", "Search complete!", 100)
 
-        search_time_ms = int((time.time() - start_time) * 1000)
+        search_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         return SearchResult(
             query=query,
@@ -167,17 +177,16 @@ class SearchOrchestrator:
         """Improved fallback query parsing without AI"""
 
         # Check for explicit separators (dash, slash, etc.)
-        for separator in [' - ', ' / ', ' | ']:
-            if separator in query:
-                parts = query.split(separator, 1)
-                return ParsedQuery(
-                    artist=parts[0].strip(),
-                    album=parts[1].strip() if len(parts) > 1 else None,
-                    track=None,
-                    year=None,
-                    query_type="album",
-                    confidence=0.8
-                )
+        parts = self._SEPARATOR_RE.split(query, 1)
+        if len(parts) == 2:
+            return ParsedQuery(
+                artist=parts[0].strip(),
+                album=parts[1].strip(),
+                track=None,
+                year=None,
+                query_type="album",
+                confidence=0.8
+            )
 
         words = query.split()
 
@@ -239,73 +248,55 @@ class SearchOrchestrator:
             confidence=0.6
         )
 
-    def _generate_explanation(self, source: MusicSource, rank: int) -> str:
-        """Generate explanation for music source ranking"""
+    def _rank_one(self, source: MusicSource, rank: int) -> Tuple[str, List[str]]:
+        """Generate explanation and tags for a ranked music source"""
+        fmt = source.format
+        bitrate = source.bitrate
+        seeders = source.seeders
+        size_bytes = source.size_bytes
+        source_type = source.source_type.value
         parts = []
+        tags = []
 
         if rank == 1:
             parts.append("🏆 Best match")
+            tags.append("best_quality")
         elif rank <= 3:
             parts.append(f"#{rank} Top result")
 
-        if source.format:
-            if source.format == "FLAC":
-                parts.append("Lossless quality")
-            else:
-                parts.append(f"{source.format}")
+        if fmt == "FLAC":
+            parts.append("Lossless quality")
+            tags.append("lossless")
 
-        if source.bitrate:
-            parts.append(f"{source.bitrate}")
+            # Check for hi-res
+            if bitrate and HIRES_PATTERN.search(bitrate):
+                tags.append("hi-res")
+        elif fmt:
+            parts.append(fmt)
+
+        if bitrate:
+            parts.append(bitrate)
 
         # Torrent-specific info
-        if source.seeders is not None:
-            if source.seeders >= 50:
-                parts.append(f"{source.seeders} seeders (very fast)")
-            elif source.seeders >= 10:
-                parts.append(f"{source.seeders} seeders (fast)")
-            elif source.seeders > 0:
-                parts.append(f"{source.seeders} seeders")
+        if seeders is not None:
+            if seeders >= 50:
+                parts.append(f"{seeders} seeders (very fast)")
+            elif seeders >= 10:
+                parts.append(f"{seeders} seeders (fast)")
+            elif seeders > 0:
+                parts.append(f"{seeders} seeders")
+            tags.extend(seeder_tags(seeders))
 
         # Size info (for torrents)
-        if source.size_bytes:
-            size_gb = source.size_bytes / (1024 * 1024 * 1024)
-            if size_gb >= 1:
-                parts.append(f"{size_gb:.1f} GB")
+        if size_bytes:
+            if size_bytes >= GB:
+                parts.append(f"{size_bytes / GB:.1f} GB")
             else:
-                size_mb = source.size_bytes / (1024 * 1024)
-                parts.append(f"{size_mb:.0f} MB")
+                parts.append(f"{size_bytes / MB:.0f} MB")
 
         # Source type indicator
-        if source.source_type.value != "torrent":
-            parts.append(f"Source: {source.source_type.value}")
-
-        return " • ".join(parts)
+        if source_type != "torrent":
+            parts.append(f"Source: {source_type}")
+            tags.append(source_type)
 
-    def _generate_tags(self, source: MusicSource, rank: int) -> List[str]:
-        """Generate tags for music source"""
-        tags = []
-
-        if rank == 1:
-            tags.append("best_quality")
-
-        if source.format == "FLAC":
-            tags.append("lossless")
-
-            # Check for hi-res
-            if source.bitrate:
-                if "24" in source.bitrate or "DSD" in source.bitrate.upper():
-                    tags.append("hi-res")
-
-        # Torrent-specific tags
-        if source.seeders is not None:
-            if source.seeders >= 50:
-                tags.append("fast")
-                tags.append("popular")
-            elif source.seeders >= 10:
-                tags.append("fast")
-
-        # Source type tag
-        if source.source_type.value != "torrent":
-            tags.append(source.source_type.value)
-
-        return tags
+        return " • ".join(parts), tags
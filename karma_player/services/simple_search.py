@@ -2,8 +2,9 @@
 Simple search orchestrator - No MusicBrainz complexity
 Just: Query → Parse → Search → Rank → Return
 """
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Tuple
 from dataclasses import dataclass
+from operator import attrgetter
 import time
 import logging
 import inspect
@@ -11,12 +12,13 @@ import inspect
 from karma_player.models.source import MusicSource, RankedSource
 from karma_player.models.query import MusicQuery
 from karma_player.services.search.engine import SearchEngine
+from karma_player.services.search.metadata import HIRES_PATTERN
 from karma_player.services.ai.query_parser import SQLLikeParser, NaturalLanguageToSQL
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SimpleSearchResult:
     """Simple search result"""
     query: str
@@ -46,7 +48,8 @@ class SimpleSearch:
         format_filter: Optional[str] = None,
         min_seeders: int = 1,
         limit: int = 50,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        results_callback: Optional[Callable] = None
     ) -> SimpleSearchResult:
         """
         Execute simple search
@@ -57,6 +60,8 @@ class SimpleSearch:
             min_seeders: Minimum seeders
             limit: Max results to return
             progress_callback: Optional progress updates
+            results_callback: Optional, called with each source's new
+                results (List[MusicSource]) as soon as that source answers
 
         Returns:
             SimpleSearchResult with ranked torrents
@@ -74,13 +79,19 @@ class SimpleSearch:
                 else:
                     progress_callback(percent, message)
 
+        async def partial_results(batch: List[MusicSource]):
+            if inspect.iscoroutinefunction(results_callback):
+                await results_callback(batch)
+            else:
+                results_callback(batch)
+
         await progress(10, "Parsing query...")
 
         # Try to parse as SQL-like query
         music_query = None
         sql_query = None
 
-        if query.upper().startswith("SELECT"):
+        if query[:6].upper() == "SELECT":
             # Already SQL-like
             music_query = SQLLikeParser.parse(query)
             sql_query = query
@@ -126,11 +137,24 @@ class SimpleSearch:
         logger.info(f"   → Search terms: '{search_str}' (min_seeders={music_query.min_seeders})")
 
         # Search
-        torrents = await self.search_engine.search(
-            query=search_str,
-            format_filter=music_query.format,
-            min_seeders=music_query.min_seeders
-        )
+        if results_callback:
+            # Hand over each source's results as it answers instead of
+            # waiting for the slowest one
+            torrents = []
+            async for batch in self.search_engine.search_stream(
+                query=search_str,
+                format_filter=music_query.format,
+                min_seeders=music_query.min_seeders
+            ):
+                torrents.extend(batch)
+                await partial_results(batch)
+            torrents.sort(key=attrgetter("quality_score"), reverse=True)
+        else:
+            torrents = await self.search_engine.search(
+                query=search_str,
+                format_filter=music_query.format,
+                min_seeders=music_query.min_seeders
+            )
 
         logger.info(f"   → Found {len(torrents)} torrents from indexers")
         await progress(70, "Ranking results...")
@@ -138,8 +162,7 @@ class SimpleSearch:
         # Rank (already sorted by quality_score)
         ranked = []
         for i, source in enumerate(torrents[:music_query.limit], 1):
-            explanation = self._explain(source, i)
-            tags = self._tag(source, i)
+            explanation, tags = self._rank_one(source, i)
 
             ranked.append(RankedSource(
                 source=source,
@@ -163,40 +186,34 @@ class SimpleSearch:
             search_time_ms=search_time_ms
         )
 
-    def _explain(self, source: MusicSource, rank: int) -> str:
-        """Generate simple explanation"""
+    def _rank_one(self, source: MusicSource, rank: int) -> Tuple[str, List[str]]:
+        """Generate simple explanation and tags"""
+        fmt = source.format
+        bitrate = source.bitrate
+        seeders = source.seeders
         parts = []
+        tags = []
 
         if rank == 1:
             parts.append("🏆")
+            tags.append("best")
 
-        if source.format:
-            parts.append(source.format)
+        if fmt:
+            parts.append(fmt)
+            if fmt == "FLAC":
+                tags.append("lossless")
+                if bitrate and HIRES_PATTERN.search(bitrate):
+                    tags.append("hi-res")
 
-        if source.bitrate:
-            parts.append(source.bitrate)
+        if bitrate:
+            parts.append(bitrate)
 
-        if source.seeders is not None:
-            parts.append(f"{source.seeders} seeders")
+        if seeders is not None:
+            parts.append(f"{seeders} seeders")
+            if seeders >= 50:
+                tags.append("fast")
 
         if source.size_formatted:
             parts.append(source.size_formatted)
 
-        return " • ".join(parts)
-
-    def _tag(self, source: MusicSource, rank: int) -> List[str]:
-        """Generate tags"""
-        tags = []
-
-        if rank == 1:
-            tags.append("best")
-
-        if source.format == "FLAC":
-            tags.append("lossless")
-            if source.bitrate and ("24" in source.bitrate or "DSD" in source.bitrate.upper()):
-                tags.append("hi-res")
-
-        if source.seeders is not None and source.seeders >= 50:
-            tags.append("fast")
-
-        return tags
+        return " • ".join(parts), tags
@@ -1,3 +1,3 @@
 """
-Torrent service - libtorrent integration for downloads
+Torrent service - transmission-daemon (RPC) integration for downloads
 """
@@ -10,9 +10,12 @@ Architecture:
   - Download Daemon API: FastAPI server using this wrapper
 """
 
+import contextlib
 import os
+import time
 import logging
-from typing import Dict, Optional
+import threading
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -36,7 +39,7 @@ class DownloadStatus(Enum):
     SEEDING = "seeding"
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadInfo:
     """Information about an active download"""
     magnet_link: str
@@ -50,13 +53,49 @@ class DownloadInfo:
     error_message: Optional[str] = None
 
 
+# Transmission statuses that map directly; 'downloading' and unknown
+# statuses depend on progress (see DownloadManager._map_status)
+_STATUS_MAP = {
+    "stopped": DownloadStatus.PAUSED,
+    "check pending": DownloadStatus.PAUSED,
+    "checking": DownloadStatus.QUEUED,
+    "download pending": DownloadStatus.QUEUED,
+    "seeding": DownloadStatus.SEEDING,
+    "seed pending": DownloadStatus.SEEDING,
+}
+
+
+@dataclass(slots=True)
+class _DownloadMeta:
+    """Our own details for a torrent (Transmission doesn't store a title)"""
+    title: str
+    magnet_link: str
+    save_path: str
+
+
 class DownloadManager:
     """
     Thin wrapper around Transmission RPC.
 
     Does NOT run its own torrent engine - delegates to transmission-daemon.
+
+    Thread-safe: the API calls it from worker threads, so RPCs and the
+    metadata/status caches are serialized by one lock (the transmission-rpc
+    client and its HTTP session aren't safe to share between threads).
     """
 
+    # Seconds to reuse get_all_downloads/get_session_stats results (also
+    # used by get_download_info), so several clients polling share one RPC
+    STATUS_CACHE_TTL = 0.3
+
+    # Torrent fields read by _build_info/_map_status; requesting only these
+    # keeps torrent-get responses small for long download lists
+    TORRENT_FIELDS = (
+        "hashString", "name", "magnetLink", "downloadDir", "status",
+        "percentDone", "rateDownload", "rateUpload", "peersConnected",
+        "error", "errorString",
+    )
+
     def __init__(
         self,
         download_path: str = None,
@@ -104,8 +143,27 @@ class DownloadManager:
                 f"Make sure transmission-daemon is running. Error: {e}"
             )
 
+        # transmission-rpc's Client is a context manager whose exit closes its
+        # HTTP session (there is no public close()); enter it so shutdown()
+        # can release the connection through that API
+        self._exit_stack = contextlib.ExitStack()
+        if hasattr(type(self.client), "__exit__"):
+            self._exit_stack.enter_context(self.client)
+        else:
+            logger.warning(
+                "transmission-rpc Client is not a context manager; "
+                "its HTTP session won't be closed on shutdown"
+            )
+
+        # Serializes RPCs and access to the caches below
+        self._lock = threading.RLock()
+
         # Cache for download metadata (Transmission doesn't store our custom titles)
-        self._metadata: Dict[str, dict] = {}
+        self._metadata: Dict[str, _DownloadMeta] = {}
+
+        # (monotonic timestamp, result) of the last successful status polls
+        self._all_cache: Optional[Tuple[float, Dict[str, DownloadInfo]]] = None
+        self._stats_cache: Optional[Tuple[float, dict]] = None
 
     def add_magnet(
         self,
@@ -130,20 +188,18 @@ class DownloadManager:
         download_dir = save_path or self.download_path
 
         try:
-            # Add torrent to Transmission
-            torrent = self.client.add_torrent(
-                magnet_link,
-                download_dir=download_dir
-            )
+            with self._lock:
+                # Add torrent to Transmission
+                torrent = self.client.add_torrent(
+                    magnet_link,
+                    download_dir=download_dir
+                )
 
-            download_id = torrent.hashString
+                download_id = torrent.hashString
 
-            # Store metadata (Transmission doesn't have a "title" field)
-            self._metadata[download_id] = {
-                "title": title,
-                "magnet_link": magnet_link,
-                "save_path": download_dir
-            }
+                # Store metadata (Transmission doesn't have a "title" field)
+                self._metadata[download_id] = _DownloadMeta(title, magnet_link, download_dir)
+                self._invalidate_status_cache()
 
             logger.info(f"✅ Added torrent: {title} (ID: {download_id[:8]}...)")
             return download_id
@@ -162,21 +218,45 @@ class DownloadManager:
         Returns:
             DownloadInfo object or None if not found
         """
-        try:
-            # Get torrent from Transmission
-            torrent = self.client.get_torrent(download_id)
-        except KeyError:
-            logger.warning(f"Torrent not found: {download_id}")
-            return None
-        except Exception as e:
-            logger.error(f"Error getting torrent info: {e}")
-            return None
+        with self._lock:
+            # Answer from a fresh get_all_downloads snapshot when there is one
+            cached = self._all_cache
+            if cached and time.monotonic() - cached[0] < self.STATUS_CACHE_TTL:
+                info = cached[1].get(download_id)
+                if info is not None:
+                    return info
+
+            try:
+                # Get torrent from Transmission
+                torrent = self.client.get_torrent(download_id, arguments=self.TORRENT_FIELDS)
+            except KeyError:
+                logger.warning(f"Torrent not found: {download_id}")
+                return None
+            except Exception as e:
+                logger.error(f"Error getting torrent info: {e}")
+                return None
+
+            return self._build_info(torrent)
+
+    def _build_info(self, torrent) -> DownloadInfo:
+        """
+        Build DownloadInfo from an already-fetched Transmission torrent.
 
+        Args:
+            torrent: transmission_rpc Torrent object
+
+        Returns:
+            DownloadInfo object
+        """
         # Get metadata
-        metadata = self._metadata.get(download_id, {})
-        title = metadata.get("title", torrent.name)
-        magnet_link = metadata.get("magnet_link", torrent.magnetLink or "")
-        save_path = torrent.downloadDir
+        metadata = self._metadata.get(torrent.hashString)
+        if metadata is not None:
+            title = metadata.title
+            magnet_link = metadata.magnet_link
+        else:
+            title = torrent.name
+            magnet_link = torrent.magnet_link or ""
+        save_path = torrent.download_dir
 
         # Map Transmission status to our DownloadStatus
         status = self._map_status(torrent)
@@ -184,17 +264,17 @@ class DownloadManager:
         # Get error message if any
         error_message = None
         if torrent.error != 0:
-            error_message = torrent.errorString
+            error_message = torrent.error_string
 
         return DownloadInfo(
             magnet_link=magnet_link,
             title=title,
             save_path=save_path,
             status=status,
-            progress=torrent.progress / 100.0,  # Transmission returns 0-100, we use 0-1
-            download_rate=float(torrent.rateDownload),  # bytes/sec
-            upload_rate=float(torrent.rateUpload),  # bytes/sec
-            num_peers=torrent.peersConnected,
+            progress=torrent.percent_done,  # 0-1
+            download_rate=float(torrent.rate_download),  # bytes/sec
+            upload_rate=float(torrent.rate_upload),  # bytes/sec
+            num_peers=torrent.peers_connected,
             error_message=error_message
         )
 
@@ -205,18 +285,22 @@ class DownloadManager:
         Returns:
             Dict mapping download_id to DownloadInfo
         """
-        result = {}
-        try:
-            torrents = self.client.get_torrents()
-            for torrent in torrents:
-                download_id = torrent.hashString
-                info = self.get_download_info(download_id)
-                if info:
-                    result[download_id] = info
-        except Exception as e:
-            logger.error(f"Error getting all downloads: {e}")
-
-        return result
+        with self._lock:
+            cached = self._all_cache
+            if cached and time.monotonic() - cached[0] < self.STATUS_CACHE_TTL:
+                return dict(cached[1])
+
+            result = {}
+            try:
+                # One RPC for all torrents; no per-torrent get_torrent round trips
+                for torrent in self.client.get_torrents(arguments=self.TORRENT_FIELDS):
+                    result[torrent.hashString] = self._build_info(torrent)
+            except Exception as e:
+                logger.error(f"Error getting all downloads: {e}")
+                return result
+
+            self._all_cache = (time.monotonic(), result)
+            return dict(result)
 
     def pause_download(self, download_id: str) -> bool:
         """
@@ -229,7 +313,9 @@ class DownloadManager:
             True if successful, False otherwise
         """
         try:
-            self.client.stop_torrent(download_id)
+            with self._lock:
+                self.client.stop_torrent(download_id)
+                self._invalidate_status_cache()
             logger.info(f"⏸️  Paused download: {download_id[:8]}...")
             return True
         except Exception as e:
@@ -247,7 +333,9 @@ class DownloadManager:
             True if successful, False otherwise
         """
         try:
-            self.client.start_torrent(download_id)
+            with self._lock:
+                self.client.start_torrent(download_id)
+                self._invalidate_status_cache()
             logger.info(f"▶️  Resumed download: {download_id[:8]}...")
             return True
         except Exception as e:
@@ -266,11 +354,12 @@ class DownloadManager:
             True if removed successfully, False otherwise
         """
         try:
-            self.client.remove_torrent(download_id, delete_data=delete_files)
+            with self._lock:
+                self.client.remove_torrent(download_id, delete_data=delete_files)
+                self._invalidate_status_cache()
 
-            # Clean up metadata
-            if download_id in self._metadata:
-                del self._metadata[download_id]
+                # Clean up metadata
+                self._metadata.pop(download_id, None)
 
             logger.info(
                 f"🗑️  Removed download: {download_id[:8]}... "
@@ -289,12 +378,21 @@ class DownloadManager:
         Just cleans up this wrapper's resources.
         """
         logger.info("Download manager shutting down...")
-        # Clear metadata cache
-        self._metadata.clear()
-        # Close client connection
-        self.client = None
+        with self._lock:
+            # Clear metadata cache
+            self._metadata.clear()
+            self._invalidate_status_cache()
+            # Close client connection (exits the client's context, which
+            # closes the requests.Session transmission-rpc keeps open)
+            self._exit_stack.close()
+            self.client = None
         logger.info("✅ Download manager shut down")
 
+    def _invalidate_status_cache(self):
+        """Drop cached status polls after a change to the torrent list."""
+        self._all_cache = None
+        self._stats_cache = None
+
     def _map_status(self, torrent) -> DownloadStatus:
         """
         Map Transmission torrent status to our DownloadStatus enum.
@@ -308,41 +406,42 @@ class DownloadManager:
         - 'seed pending': Queued for seeding
         - 'seeding': Currently seeding
         """
-        status_str = torrent.status
-
         # Check for errors first
         if torrent.error != 0:
             return DownloadStatus.ERROR
 
+        # transmission-rpc returns a str-valued Status enum
+        status_str = getattr(torrent.status, "value", torrent.status)
+
         # Map Transmission statuses
-        if status_str in ['stopped', 'check pending']:
-            return DownloadStatus.PAUSED
-        elif status_str in ['checking', 'download pending']:
-            return DownloadStatus.QUEUED
-        elif status_str == 'downloading':
-            # Check if actually complete (progress = 100%)
-            if torrent.progress >= 100:
-                return DownloadStatus.COMPLETED
-            return DownloadStatus.DOWNLOADING
-        elif status_str in ['seeding', 'seed pending']:
-            return DownloadStatus.SEEDING
-        else:
-            # Unknown status, default to downloading if progress < 100
-            if torrent.progress < 100:
-                return DownloadStatus.DOWNLOADING
+        status = _STATUS_MAP.get(status_str)
+        if status is not None:
+            return status
+
+        # 'downloading' (or unknown status): complete once progress hits 100%
+        if torrent.progress >= 100:
             return DownloadStatus.COMPLETED
+        return DownloadStatus.DOWNLOADING
 
     def get_session_stats(self) -> dict:
         """Get Transmission session statistics."""
-        try:
-            stats = self.client.session_stats()
-            return {
-                "download_speed": stats.downloadSpeed,
-                "upload_speed": stats.uploadSpeed,
-                "active_torrents": stats.activeTorrentCount,
-                "paused_torrents": stats.pausedTorrentCount,
-                "total_torrents": stats.torrentCount
-            }
-        except Exception as e:
-            logger.error(f"Failed to get session stats: {e}")
-            return {}
+        with self._lock:
+            cached = self._stats_cache
+            if cached and time.monotonic() - cached[0] < self.STATUS_CACHE_TTL:
+                return dict(cached[1])
+
+            try:
+                stats = self.client.session_stats()
+                result = {
+                    "download_speed": stats.downloadSpeed,
+                    "upload_speed": stats.uploadSpeed,
+                    "active_torrents": stats.activeTorrentCount,
+                    "paused_torrents": stats.pausedTorrentCount,
+                    "total_torrents": stats.torrentCount
+                }
+            except Exception as e:
+                logger.error(f"Failed to get session stats: {e}")
+                return {}
+
+            self._stats_cache = (time.monotonic(), result)
+            return dict(result)
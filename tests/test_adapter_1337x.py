@@ -0,0 +1,95 @@
+"""Tests for 1337x page parsing."""
+
+from datetime import datetime, timezone
+
+from lxml import etree
+
+from karma_player.services.search.adapter_1337x import (
+    _parse_detail_page,
+    _parse_upload_date,
+    _row_detail_path,
+)
+
+
+DETAIL_HTML = b"""
+<html><body>
+<h1> Pink Floyd - The Wall [FLAC 24bit] </h1>
+<a href="magnet:?xt=urn:btih:ABCDEF0123456789ABCDEF0123456789ABCDEF01&dn=wall">Magnet Download</a>
+<ul class="list">
+  <li><strong>Total size</strong> <span>1.2 GB</span></li>
+  <li><strong>Date uploaded</strong> <span>Jan. 1st '24</span></li>
+  <li><strong>Seeders</strong> <span class="seeds">42</span></li>
+  <li><strong>Leechers</strong> <span class="leeches">3</span></li>
+</ul>
+</body></html>
+"""
+
+
+class TestParseDetailPage:
+    """Test _parse_detail_page."""
+
+    def test_extracts_fields(self):
+        """Test magnet, title and info list fields are extracted."""
+        details = _parse_detail_page(DETAIL_HTML)
+
+        assert details["magnet_link"].startswith("magnet:?xt=urn:btih:ABCDEF")
+        assert details["title"] == "Pink Floyd - The Wall [FLAC 24bit]"
+        assert details["seeders"] == 42
+        assert details["leechers"] == 3
+        assert details["size_bytes"] == int(1.2 * 1024**3)
+        assert details["uploaded_at"] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def test_missing_magnet_returns_none(self):
+        """Test page without a magnet link is skipped."""
+        assert _parse_detail_page(b"<html><body><h1>Nothing</h1></body></html>") is None
+
+    def test_info_item_text_outside_child_tags(self):
+        """Test values written as tail text of a child tag are kept."""
+        html = (
+            b'<a href="magnet:?xt=urn:btih:0123456789abcdef0123456789abcdef01234567">m</a>'
+            b"<ul><li><strong>Seeders</strong> 7</li><li><b>Leechers</b> 2</li></ul>"
+        )
+
+        details = _parse_detail_page(html)
+
+        assert details["title"] == "Unknown"
+        assert details["seeders"] == 7
+        assert details["leechers"] == 2
+
+
+class TestParseUploadDate:
+    """Test _parse_upload_date."""
+
+    def test_ordinal_suffixes(self):
+        """Test 1337x date strings with each ordinal suffix."""
+        assert _parse_upload_date("Mar. 2nd '23") == datetime(2023, 3, 2, tzinfo=timezone.utc)
+        assert _parse_upload_date("Oct. 23rd '19") == datetime(2019, 10, 23, tzinfo=timezone.utc)
+        assert _parse_upload_date("Sep. 11th '21") == datetime(2021, 9, 11, tzinfo=timezone.utc)
+
+    def test_unparseable(self):
+        """Test unknown months and impossible days return None."""
+        assert _parse_upload_date("Foo. 1st '24") is None
+        assert _parse_upload_date("Feb. 31st '24") is None
+        assert _parse_upload_date("yesterday") is None
+
+
+class TestRowDetailPath:
+    """Test _row_detail_path."""
+
+    def test_only_result_table_rows(self):
+        """Test detail links are taken from table-list rows only."""
+        html = (
+            '<table class="table-list table"><tbody>'
+            '<tr><td class="coll-1 name"><a href="/sub/1/">i</a>'
+            '<a href="/torrent/1/the-wall/">The Wall</a></td></tr>'
+            '<tr><td class="coll-1 name"><a href="/sub/1/">i</a></td></tr>'
+            "</tbody></table>"
+            '<table class="other"><tbody>'
+            '<tr><td class="coll-1"><a href="/a/">a</a><a href="/b/">b</a></td></tr>'
+            "</tbody></table>"
+        )
+        root = etree.fromstring(html, etree.HTMLParser())
+
+        paths = [_row_detail_path(row) for row in root.iter("tr")]
+
+        assert paths == ["/torrent/1/the-wall/", None, None]
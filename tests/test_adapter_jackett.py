@@ -0,0 +1,118 @@
+"""Tests for Jackett Torznab parsing."""
+
+import pytest
+
+from karma_player.services.search.adapter_jackett import (
+    AdapterJackett,
+    _format_from_title_hints,
+)
+
+
+TORZNAB_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:torznab="http://torznab.com/schemas/2015/feed">
+<channel>
+  <item>
+    <title>Pink Floyd - The Wall [FLAC]</title>
+    <link>http://jackett/dl/1</link>
+    <size>123456</size>
+    <pubDate>Mon, 01 Jan 2024 12:00:00 +0000</pubDate>
+    <category>3040</category>
+    <jackettindexer>RuTracker</jackettindexer>
+    <torznab:attr name="seeders" value="5"/>
+    <torznab:attr name="peers" value="2"/>
+    <torznab:attr name="magneturl" value="magnet:?xt=urn:btih:ABCDEF0123456789ABCDEF0123456789ABCDEF01&amp;dn=wall"/>
+  </item>
+  <item>
+    <title>Some Album</title>
+    <link>magnet:?xt=urn:btih:0123456789abcdef0123456789abcdef01234567</link>
+    <category>3010</category>
+    <torznab:attr name="size" value="777"/>
+  </item>
+  <item>
+    <title>Proxy Only</title>
+    <link>http://jackett/dl/3</link>
+  </item>
+</channel>
+</rss>
+"""
+
+
+class TestParseTorznabXml:
+    """Test AdapterJackett._parse_torznab_xml."""
+
+    def test_extracts_items(self):
+        """Test magnet items are mapped to MusicSource and proxy links skipped."""
+        results = AdapterJackett()._parse_torznab_xml(TORZNAB_XML)
+
+        assert [r.title for r in results] == ["Pink Floyd - The Wall [FLAC]", "Some Album"]
+        first, second = results
+        assert first.id == "abcdef0123456789abcdef0123456789abcdef01"
+        assert first.indexer == "RuTracker"
+        assert (first.seeders, first.leechers, first.size_bytes) == (5, 2, 123456)
+        assert first.uploaded_at.year == 2024
+        assert second.format == "MP3"  # inferred from category
+        assert second.size_bytes == 777
+        assert second.indexer == "Jackett"
+
+    def test_invalid_xml(self):
+        """Test malformed responses produce no results."""
+        assert AdapterJackett()._parse_torznab_xml("<rss><channel>") == []
+
+
+class _FakeResponse:
+    status_code = 200
+    content = TORZNAB_XML.encode("utf-8")
+
+
+class _FakeClient:
+    is_closed = False
+
+    def __init__(self):
+        self.requests = 0
+
+    async def get(self, url, params=None):
+        self.requests += 1
+        return _FakeResponse()
+
+
+class TestCategoryParam:
+    """Test the Torznab cat parameter."""
+
+    def test_default_audio_categories_use_parent(self):
+        """Test the full default audio set is sent as the Audio parent."""
+        assert AdapterJackett()._cat_param == "3000"
+
+    def test_custom_categories_deduplicated(self):
+        """Test custom category lists keep their order without duplicates."""
+        assert AdapterJackett(categories=[3040, 3010, 3040])._cat_param == "3040,3010"
+
+
+class TestSearchCache:
+    """Test AdapterJackett search result caching."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_query_served_from_cache(self):
+        """Test identical queries hit Jackett once until the TTL passes."""
+        adapter = AdapterJackett(api_key="key")
+        adapter._client = client = _FakeClient()
+
+        first = await adapter.search("the wall")
+        second = await adapter.search("the wall")
+        assert client.requests == 1
+        assert [r.id for r in second] == [r.id for r in first]
+
+        cache_key = next(iter(adapter._search_cache))
+        adapter._search_cache[cache_key] = (-adapter.SEARCH_CACHE_TTL, [])
+        await adapter.search("the wall")
+        assert client.requests == 2
+
+
+class TestFormatFromTitleHints:
+    """Test _format_from_title_hints."""
+
+    def test_priority_and_substrings(self):
+        """Test FLAC beats MP3 beats AAC and hints match inside words."""
+        assert _format_from_title_hints("Album 24-Bit MP3 AAC") == "FLAC"
+        assert _format_from_title_hints("Album [320kbps] aac") == "MP3"
+        assert _format_from_title_hints("Album.AAC.256") == "AAC"
+        assert _format_from_title_hints("Album") is None
@@ -0,0 +1,100 @@
+"""Tests for YouTube Music stream URL handling."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from karma_player.services.search import adapter_youtube_music
+from karma_player.services.search.adapter_youtube_music import (
+    STREAM_URL_EXPIRY_MARGIN,
+    STREAM_URL_TTL,
+    AdapterYouTubeMusic,
+    _cached_stream_url,
+    _store_stream_url,
+    _stream_url_expires_at,
+)
+
+
+class _FakeYoutubeDL:
+    """yt-dlp stand-in that counts extractions."""
+
+    calls = 0
+
+    def __init__(self, opts):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def extract_info(self, url, download=False):
+        type(self).calls += 1
+        video_id = url.rsplit("=", 1)[1]
+        audio = {"acodec": "opus", "vcodec": "none", "abr": 160, "url": f"https://audio/{video_id}"}
+        return {"formats": [audio]}
+
+
+class TestStreamUrlExpiresAt:
+    """Test _stream_url_expires_at."""
+
+    def test_honors_signed_expire(self):
+        """Test the URL's expire parameter wins when it comes first."""
+        url = "https://rr1.googlevideo.com/videoplayback?expire=1000600&id=abc"
+
+        assert _stream_url_expires_at(url, now=1000000) == 1000600 - STREAM_URL_EXPIRY_MARGIN
+
+    def test_falls_back_to_ttl(self):
+        """Test URLs without (or with a distant/garbled) expire use the TTL."""
+        now = 1000000
+        assert _stream_url_expires_at("https://example.com/a", now) == now + STREAM_URL_TTL
+        assert _stream_url_expires_at("https://x/?expire=9999999999", now) == now + STREAM_URL_TTL
+        assert _stream_url_expires_at("https://x/?expire=soon", now) == now + STREAM_URL_TTL
+
+
+class TestStreamUrlCache:
+    """Test the stream URL LRU cache."""
+
+    def test_evicts_expired_then_least_recently_used(self, monkeypatch):
+        """Test inserts drop expired URLs and keep the cache at its size cap."""
+        cache = adapter_youtube_music._STREAM_URL_CACHE
+        monkeypatch.setattr(adapter_youtube_music, "STREAM_URL_CACHE_SIZE", 2)
+        cache.clear()
+
+        now = time.time()
+        cache["stale"] = (now - 1, "https://audio/stale")
+        _store_stream_url("a", "https://audio/a")
+        assert list(cache) == ["a"]
+
+        _store_stream_url("b", "https://audio/b")
+        assert _cached_stream_url("a") == "https://audio/a"
+        _store_stream_url("c", "https://audio/c")
+
+        assert list(cache) == ["a", "c"]
+        cache.clear()
+
+
+class TestResolveStreamUrl:
+    """Test AdapterYouTubeMusic._resolve_stream_url."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_and_repeat_requests_share_one_extraction(self):
+        """Test yt-dlp runs once for concurrent and later lookups of one ID."""
+        with patch.object(adapter_youtube_music, "YTMusic"):
+            adapter = AdapterYouTubeMusic()
+        adapter_youtube_music._STREAM_URL_CACHE.pop("vid123", None)
+        _FakeYoutubeDL.calls = 0
+
+        with patch.object(adapter_youtube_music.yt_dlp, "YoutubeDL", _FakeYoutubeDL):
+            urls = await asyncio.gather(
+                *(adapter._resolve_stream_url("vid123") for _ in range(3))
+            )
+            again = await adapter._resolve_stream_url("vid123")
+
+        assert urls == ["https://audio/vid123"] * 3
+        assert again == "https://audio/vid123"
+        assert _FakeYoutubeDL.calls == 1
+        assert adapter._inflight == {}
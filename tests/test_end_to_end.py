@@ -107,6 +107,8 @@ async def test_end_to_end():
                 print(f"   Infohash: {torrent.infohash[:16]}...")
                 print()
 
+    await orchestrator.close()
+
     # Final summary
     print("=" * 90)
     print("✨ END-TO-END FLOW COMPLETE!")
@@ -0,0 +1,157 @@
+"""Tests for SearchEngine result merging."""
+
+import asyncio
+
+import pytest
+
+from karma_player.models.source import MusicSource, SourceType
+from karma_player.services.search.engine import SearchEngine
+from karma_player.services.simple_search import SimpleSearch
+from karma_player.services.search.source_adapter import SourceAdapter
+
+
+def _torrent(infohash, format="FLAC", seeders=10, score=0.0):
+    source = MusicSource(
+        id=infohash,
+        title=f"Album {infohash}",
+        format=format,
+        url=f"magnet:?xt=urn:btih:{infohash}",
+        seeders=seeders,
+    )
+    source.quality_score = score
+    return source
+
+
+def _stream(video_id, format="OPUS", score=0.0):
+    source = MusicSource(id=video_id, title="Stream", format=format, source_type=SourceType.YOUTUBE)
+    source.quality_score = score
+    return source
+
+
+class _StaticAdapter(SourceAdapter):
+    """Adapter returning a fixed result list."""
+
+    def __init__(self, results, delay=0.0):
+        super().__init__()
+        self.results = results
+        self.delay = delay
+
+    @property
+    def name(self):
+        return "static"
+
+    @property
+    def source_type(self):
+        return SourceType.TORRENT
+
+    async def search(self, query):
+        await asyncio.sleep(self.delay)
+        return list(self.results)
+
+
+class TestSearchEngine:
+    """Test SearchEngine.search."""
+
+    @pytest.mark.asyncio
+    async def test_filters_dedupes_and_sorts(self):
+        """Test format/seeder filters, infohash dedup and quality ordering."""
+        engine = SearchEngine([
+            _StaticAdapter([_torrent("aa", score=1), _torrent("bb", format="MP3", score=9)]),
+            _StaticAdapter([
+                _torrent("aa", score=5),
+                _torrent("cc", seeders=1, score=8),
+                _torrent("dd", score=3),
+                _stream("yt", format="flac", score=2),
+            ]),
+        ])
+
+        results = await engine.search("q", format_filter="flac", min_seeders=5)
+
+        assert [(r.id, r.quality_score) for r in results] == [("dd", 3), ("yt", 2), ("aa", 1)]
+
+    @pytest.mark.asyncio
+    async def test_limit_returns_top_results(self):
+        """Test limit keeps only the highest scoring results, in order."""
+        engine = SearchEngine([
+            _StaticAdapter([
+                _torrent(h, score=score)
+                for h, score in [("a", 2), ("b", 7), ("c", 5), ("d", 1)]
+            ]),
+        ])
+
+        results = await engine.search("q", min_seeders=0, limit=2)
+
+        assert [r.id for r in results] == ["b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_adapter_timeout_drops_slow_adapters(self):
+        """Test adapters past adapter_timeout are skipped and count as failed."""
+        slow = _StaticAdapter([_torrent("bb")], delay=10)
+        engine = SearchEngine([slow, _StaticAdapter([_torrent("aa")])], adapter_timeout=0.05)
+
+        results = await engine.search("q", min_seeders=0)
+
+        assert [r.id for r in results] == ["aa"]
+        assert slow._consecutive_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_search_stream_yields_fast_adapters_first(self):
+        """Test batches arrive in completion order and stay deduplicated."""
+        engine = SearchEngine([
+            _StaticAdapter([_torrent("aa"), _torrent("bb")], delay=0.05),
+            _StaticAdapter([_torrent("aa"), _torrent("cc")]),
+        ])
+
+        batches = [
+            [r.id for r in batch]
+            async for batch in engine.search_stream("q", min_seeders=0)
+        ]
+
+        assert batches == [["aa", "cc"], ["bb"]]
+
+    @pytest.mark.asyncio
+    async def test_search_stream_soft_deadline_drops_slow_adapters(self):
+        """Test adapters slower than the soft deadline are cancelled."""
+        slow = _StaticAdapter([_torrent("bb")], delay=10)
+        engine = SearchEngine([slow, _StaticAdapter([_torrent("aa")])])
+
+        batches = [
+            [r.id for r in batch]
+            async for batch in engine.search_stream("q", min_seeders=0, soft_deadline=0.05)
+        ]
+
+        assert batches == [["aa"]]
+        assert slow.is_healthy
+
+    @pytest.mark.asyncio
+    async def test_format_filter_is_case_insensitive(self):
+        """Test lowercase source formats and filters still match."""
+        engine = SearchEngine([
+            _StaticAdapter([_torrent("aa", format="flac"), _torrent("bb", format="mp3")]),
+        ])
+
+        results = await engine.search("q", format_filter="Flac", min_seeders=0)
+
+        assert [(r.id, r.format) for r in results] == [("aa", "FLAC")]
+
+
+class TestSimpleSearchStreaming:
+    """Test SimpleSearch with a results callback."""
+
+    @pytest.mark.asyncio
+    async def test_results_callback_gets_each_batch_before_ranking(self):
+        """Test batches are handed over as they arrive and the ranking is unchanged."""
+        engine = SearchEngine([
+            _StaticAdapter([_torrent("aa", score=1), _torrent("bb", score=9)], delay=0.05),
+            _StaticAdapter([_torrent("cc", score=5)]),
+        ])
+        batches = []
+
+        result = await SimpleSearch(engine).search(
+            'SELECT album WHERE artist="X"',
+            min_seeders=0,
+            results_callback=lambda batch: batches.append([r.id for r in batch]),
+        )
+
+        assert batches == [["cc"], ["bb", "aa"]]
+        assert [r.source.id for r in result.results] == ["bb", "cc", "aa"]
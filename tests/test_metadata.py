@@ -0,0 +1,55 @@
+"""Tests for release title metadata extraction."""
+
+from karma_player.services.search.metadata import HIRES_PATTERN, MetadataExtractor
+
+
+class TestMetadataExtractor:
+    """Test MetadataExtractor."""
+
+    def test_extract_all(self):
+        """Test format, bitrate and source come back together."""
+        assert MetadataExtractor.extract_all("Album [WEB MP3 320kbps]") == ("MP3", "320", "WEB")
+        assert MetadataExtractor.extract_all("Album (Vinyl Rip) FLAC") == ("FLAC", None, "Vinyl")
+        assert MetadataExtractor.extract_all("Album Name") == (None, None, None)
+        assert MetadataExtractor.extract_all("") == (None, None, None)
+
+    def test_extract_all_matches_single_extractors(self):
+        """Test extract_all agrees with the per-field extractors."""
+        for title in ["Album [FLAC MP3]", "Album [MP3 V0] CD", "Album Opus BD", "Album [web]"]:
+            assert MetadataExtractor.extract_all(title) == (
+                MetadataExtractor.extract_format(title),
+                MetadataExtractor.extract_bitrate(title),
+                MetadataExtractor.extract_source(title),
+            )
+
+    def test_parse_size_units(self):
+        """Test GB/MB/KB size parsing."""
+        assert MetadataExtractor.parse_size("1.5 GB") == 1610612736
+        assert MetadataExtractor.parse_size("500 MB") == 524288000
+        assert MetadataExtractor.parse_size("500 KB") == 512000
+        assert MetadataExtractor.parse_size("1 gb") == 1073741824
+
+    def test_parse_size_with_comma(self):
+        """Test comma decimal separator."""
+        assert MetadataExtractor.parse_size("1,5 GB") == 1610612736
+
+    def test_parse_size_invalid(self):
+        """Test invalid sizes return 0."""
+        assert MetadataExtractor.parse_size("invalid") == 0
+        assert MetadataExtractor.parse_size("") == 0
+        assert MetadataExtractor.parse_size("ABC GB") == 0
+        assert MetadataExtractor.parse_size("1000") == 0
+
+
+class TestHiresPattern:
+    """Test HIRES_PATTERN."""
+
+    def test_matches_hires_bitrates(self):
+        """Test 24-bit and DSD bitrates count as hi-res, in any case."""
+        for bitrate in ["24bit", "24/96", "DSD64", "dsd128"]:
+            assert HIRES_PATTERN.search(bitrate)
+
+    def test_ignores_other_bitrates(self):
+        """Test 16-bit and lossy bitrates don't count as hi-res."""
+        for bitrate in ["16bit", "320", "V0"]:
+            assert not HIRES_PATTERN.search(bitrate)
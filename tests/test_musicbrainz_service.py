@@ -0,0 +1,92 @@
+"""Tests for MusicBrainzService."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from karma_player.services.musicbrainz_service import MusicBrainzService
+
+
+RELEASE_SEARCH_JSON = {
+    "releases": [
+        {
+            "id": "b84ee12a-09ef-421b-82de-0441a926375b",
+            "title": "OK Computer",
+            "date": "1997-05-21",
+            "country": "GB",
+            "barcode": "724385522925",
+            "artist-credit": [{"artist": {"name": "Radiohead"}}],
+            "label-info": [{"label": {"name": "Parlophone"}}],
+        },
+        {
+            "id": "0b6b4ba0-d36f-47bd-b4ea-6a5b91842d29",
+            "title": "OK Computer",
+        },
+    ]
+}
+
+
+class TestMusicBrainzService:
+    """Test MusicBrainzService."""
+
+    @pytest.fixture
+    def service(self):
+        """Create service with the web service call mocked out."""
+        service = MusicBrainzService()
+        service._get_json = AsyncMock(return_value=RELEASE_SEARCH_JSON)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_search_release_parses_json(self, service):
+        """Test release search results are mapped to MBResult."""
+        results = await service.search_release(artist="Radiohead", album="OK Computer", limit=5)
+
+        service._get_json.assert_awaited_once_with(
+            "release/", {"query": 'artist:"Radiohead" AND release:"OK Computer"', "limit": 5}
+        )
+        assert len(results) == 2
+        assert results[0].artist == "Radiohead"
+        assert results[0].label == "Parlophone"
+        assert results[0].release_date == "1997-05-21"
+        assert results[1].artist == "Unknown Artist"
+        assert results[1].label is None
+
+    @pytest.mark.asyncio
+    async def test_search_release_without_terms(self, service):
+        """Test empty query does not hit the web service."""
+        assert await service.search_release() == []
+        service._get_json.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_search_release_cached_case_insensitively(self, service):
+        """Test repeated searches differing only in case hit the cache."""
+        first = await service.search_release(artist="Radiohead", album="OK Computer")
+        second = await service.search_release(artist=" radiohead", album="ok computer ")
+
+        assert service._get_json.await_count == 1
+        assert [r.mbid for r in second] == [r.mbid for r in first]
+
+    @pytest.mark.asyncio
+    async def test_search_cache_expires(self, service):
+        """Test cached searches are refetched after the TTL."""
+        await service.search_release(artist="Radiohead")
+        service._search_cache[next(iter(service._search_cache))] = (
+            -service.SEARCH_CACHE_TTL,
+            [],
+        )
+
+        await service.search_release(artist="Radiohead")
+
+        assert service._get_json.await_count == 2
+
+    def test_parse_release_tolerates_null_fields(self):
+        """Test null or empty credit/label entries fall back to defaults."""
+        result = MusicBrainzService._parse_release({
+            "id": "1",
+            "title": "Untitled",
+            "artist-credit": [],
+            "label-info": [{"label": None}],
+        })
+
+        assert result.artist == "Unknown Artist"
+        assert result.label is None
+        assert result.release_date == ""
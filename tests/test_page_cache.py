@@ -0,0 +1,61 @@
+"""Tests for the on-disk page cache."""
+
+import time
+
+from karma_player.services.search.page_cache import PageCache
+
+
+class TestPageCache:
+    """Test PageCache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test stored values are returned as JSON-decoded objects."""
+        cache = PageCache(tmp_path / "pages.sqlite3")
+        cache.set("detail:a", {"title": "x", "seeders": 3}, ttl=60)
+
+        assert cache.get("detail:a") == {"title": "x", "seeders": 3}
+        assert cache.get("detail:b") is None
+        cache.close()
+
+    def test_expired_entry_is_missing(self, tmp_path, monkeypatch):
+        """Test entries are ignored once their TTL has passed."""
+        cache = PageCache(tmp_path / "pages.sqlite3")
+        cache.set("search:q", ["u1", "u2"], ttl=10)
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+
+        assert cache.get("search:q") is None
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test a new cache on the same file sees earlier entries."""
+        path = tmp_path / "nested" / "pages.sqlite3"
+        first = PageCache(path)
+        first.set("k", [1, 2], ttl=60)
+        first.close()
+
+        assert PageCache(path).get("k") == [1, 2]
+
+    def test_expired_entries_are_deleted(self, tmp_path, monkeypatch):
+        """Test expired rows are removed on write instead of piling up."""
+        cache = PageCache(tmp_path / "pages.sqlite3")
+        cache.set("old", 1, ttl=10)
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+        cache.set("new", 2, ttl=10)
+
+        keys = [row[0] for row in cache._conn.execute("SELECT key FROM pages")]
+        assert keys == ["new"]
+        cache.close()
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """Test an undecodable value is treated as missing."""
+        cache = PageCache(tmp_path / "pages.sqlite3")
+        cache.set("k", [1], ttl=60)
+        with cache._conn:
+            cache._conn.execute("UPDATE pages SET value = '{not json' WHERE key = 'k'")
+
+        assert cache.get("k") is None
+        cache.close()
@@ -0,0 +1,75 @@
+"""Tests for SQL-like query parsing."""
+
+from karma_player.services.ai.query_parser import SQLLikeParser
+
+
+class TestSQLLikeParser:
+    """Test SQLLikeParser."""
+
+    def test_parse_select_only(self):
+        """Test query without WHERE clause."""
+        query = SQLLikeParser.parse("SELECT track")
+
+        assert query.query_type == "track"
+        assert query.artist is None
+        assert query.limit == 50
+
+    def test_parse_invalid_query(self):
+        """Test non-SQL query returns None."""
+        assert SQLLikeParser.parse("radiohead ok computer") is None
+
+    def test_parse_string_fields(self):
+        """Test string equality conditions."""
+        query = SQLLikeParser.parse(
+            'SELECT album WHERE artist="Radiohead" AND album="OK Computer" AND format="flac"'
+        )
+
+        assert query.artist == "Radiohead"
+        assert query.album == "OK Computer"
+        assert query.format == "FLAC"
+
+    def test_quoted_number_does_not_set_year(self):
+        """Test quoted numeric value is treated as a string."""
+        query = SQLLikeParser.parse('SELECT album WHERE artist="1997"')
+
+        assert query.artist == "1997"
+        assert query.year is None
+
+    def test_numeric_fields_in_one_pass(self):
+        """Test year and limit are both set from the WHERE clause."""
+        query = SQLLikeParser.parse("SELECT album WHERE year=1997 AND limit=10")
+
+        assert query.year == 1997
+        assert query.limit == 10
+
+    def test_year_range(self):
+        """Test BETWEEN condition."""
+        query = SQLLikeParser.parse(
+            'SELECT album WHERE artist="Miles Davis" AND year BETWEEN 1955 AND 1965'
+        )
+
+        assert query.artist == "Miles Davis"
+        assert query.year_range == (1955, 1965)
+        assert query.year is None
+
+    def test_comparisons(self):
+        """Test seeders/size comparisons."""
+        query = SQLLikeParser.parse(
+            'SELECT album WHERE artist="Pink Floyd" AND seeders>=10 AND size>=100 AND size<=900'
+        )
+
+        assert query.min_seeders == 10
+        assert query.min_size_mb == 100
+        assert query.max_size_mb == 900
+
+    def test_order_and_limit(self):
+        """Test ORDER BY and LIMIT/OFFSET clauses."""
+        query = SQLLikeParser.parse(
+            'SELECT track WHERE title="Karma Police" ORDER BY seeders ASC LIMIT 10 OFFSET 20'
+        )
+
+        assert query.track == "Karma Police"
+        assert query.order_by == "seeders"
+        assert query.order_desc is False
+        assert query.limit == 10
+        assert query.offset == 20